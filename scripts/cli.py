@@ -2,23 +2,112 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import sys
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 import typer
 
-app = typer.Typer(help="Feuerwehr Bröckel tools.", no_args_is_help=True)
-screenshots_app = typer.Typer(help="Screenshot pipeline.", no_args_is_help=True)
-migration_app = typer.Typer(
-    help="Fox112 → FeuerON data migration.", no_args_is_help=True
-)
+from scripts.main import APP_HELP, GROUP_HELP, package_version
 
-api_app = typer.Typer(help="FeuerON REST API client.", no_args_is_help=True)
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
-app.add_typer(screenshots_app, name="screenshots")
-app.add_typer(migration_app, name="migration")
-app.add_typer(api_app, name="api")
+app = typer.Typer(help=APP_HELP, no_args_is_help=True)
+screenshots_app = typer.Typer(help=GROUP_HELP["screenshots"], no_args_is_help=True)
+migration_app = typer.Typer(help=GROUP_HELP["migration"], no_args_is_help=True)
+api_app = typer.Typer(help=GROUP_HELP["api"], no_args_is_help=True)
+
+_GROUPS = {
+    "screenshots": screenshots_app,
+    "migration": migration_app,
+    "api": api_app,
+}
+
+
+def _sniff_subcommand() -> str | None:
+    """Return the subcommand group named on the command line, if any.
+
+    Only the first positional argument is considered, so ``info --help``
+    and ``info`` without arguments still see every group.
+    """
+    for arg in sys.argv[1:]:
+        if not arg.startswith("-"):
+            return arg if arg in _GROUPS else None
+    return None
+
+
+def _print_version(value: bool) -> None:
+    """Handle ``--version`` (also answered by the fast path in scripts.main)."""
+    if value:
+        typer.echo(package_version())
+        raise typer.Exit()
+
+
+@app.callback()
+def _root(
+    version: bool = typer.Option(
+        False,
+        "--version",
+        "-V",
+        callback=_print_version,
+        is_eager=True,
+        help="Show the version and exit.",
+    ),
+) -> None:
+    """Handle the global options."""
+
+
+# Register only the invoked group so Typer does not build the others.
+_invoked = _sniff_subcommand()
+for _name, _group in _GROUPS.items():
+    if _invoked is None or _name == _invoked:
+        app.add_typer(_group, name=_name)
+
+
+class _LazyRichHandler(logging.Handler):
+    """Logging handler that imports Rich only when the first record is emitted."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._rich: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._rich is None:
+            from rich.logging import RichHandler
+
+            self._rich = RichHandler(rich_tracebacks=True, show_path=False)
+            self._rich.setFormatter(self.formatter)
+        self._rich.handle(record)
+
+
+@functools.cache
+def _configure_logging() -> None:
+    """Route log output through Rich for the migration and API commands."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[_LazyRichHandler()],
+    )
+
+
+def _echo_models(models: Iterable[BaseModel], pretty: bool) -> None:
+    """Print *models* as NDJSON, or as one indented JSON array if *pretty*."""
+    if pretty:
+        import json
+
+        typer.echo(
+            json.dumps(
+                [m.model_dump(by_alias=True) for m in models],
+                indent=2,
+                ensure_ascii=False,
+            )
+        )
+        return
+    for m in models:
+        typer.echo(m.model_dump_json(by_alias=True))
 
 
 # ---------------------------------------------------------------------------
@@ -29,14 +118,10 @@ app.add_typer(api_app, name="api")
 @screenshots_app.command()
 def generate() -> None:
     """Run the full screenshot pipeline (capture → annotate → frame)."""
-    from scripts.feueron.generate import (
-        apply_annotations,
-        apply_frames,
-        generate_screenshots,
-    )
+    from scripts.feueron.generate import apply_frames, run_pipeline
 
-    generate_screenshots()
-    apply_annotations()
+    run_pipeline()
+    # Frame any annotated images left over from earlier runs.
     apply_frames()
 
 
@@ -49,19 +134,27 @@ def capture() -> None:
 
 
 @screenshots_app.command()
-def annotate() -> None:
+def annotate(
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild images even if they look up to date."
+    ),
+) -> None:
     """Apply annotations to existing screenshots."""
     from scripts.feueron.generate import apply_annotations
 
-    apply_annotations()
+    apply_annotations(force=force)
 
 
 @screenshots_app.command()
-def frame() -> None:
+def frame(
+    force: bool = typer.Option(
+        False, "--force", help="Rebuild images even if they look up to date."
+    ),
+) -> None:
     """Wrap screenshots in browser frames."""
     from scripts.feueron.generate import apply_frames
 
-    apply_frames()
+    apply_frames(force=force)
 
 
 # ---------------------------------------------------------------------------
@@ -84,13 +177,7 @@ def bank_check(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts."),
 ) -> None:
     """Build a FeuerON bank-detail-update CSV from Fox112 master data."""
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    _configure_logging()
 
     from scripts.feueron.migration.bank_check import build_bank_update
 
@@ -119,13 +206,7 @@ def contact_check(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts."),
 ) -> None:
     """Build a FeuerON contact-update CSV (address + phone + email) from Fox112."""
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    _configure_logging()
 
     from scripts.feueron.migration.contact_check import build_contact_update
 
@@ -167,13 +248,7 @@ def passive_import(
     Produces two CSV files: one for persons with Beiträge data and one for
     persons without, since FeuerON cannot handle mixed rows.
     """
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    _configure_logging()
 
     from scripts.feueron.migration.passive_import import build_passive_import
 
@@ -202,20 +277,15 @@ def dedup_erreichbarkeiten_cmd(
     ),
 ) -> None:
     """Remove duplicate Erreichbarkeiten entries created by CSV import."""
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    _configure_logging()
 
     from scripts.feueron.api import FeuerONClient
+    from scripts.feueron.api.client import DEFAULT_SESSION_CACHE
     from scripts.feueron.migration.erreichbarkeiten_dedup import (
         dedup_erreichbarkeiten,
     )
 
-    with FeuerONClient(base_url) as client:
+    with FeuerONClient(base_url, session_cache=DEFAULT_SESSION_CACHE) as client:
         dedup_erreichbarkeiten(client, dry_run=dry_run, yes=yes)
 
 
@@ -235,33 +305,27 @@ def api_search(
         "--base-url",
         help="FeuerON base URL.",
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Print one indented JSON array instead of NDJSON."
+    ),
 ) -> None:
-    """Search persons in FeuerON via the REST API."""
-    import json
+    """Search persons in FeuerON via the REST API.
 
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    Prints one JSON object per line (NDJSON) unless ``--pretty`` is given.
+    """
+    _configure_logging()
 
     from scripts.feueron.api import FeuerONClient
+    from scripts.feueron.api.client import DEFAULT_SESSION_CACHE
 
     kwargs: dict[str, Any] = {}
     if org_id is not None:
         kwargs["organisation_id"] = org_id
 
-    with FeuerONClient(base_url, **kwargs) as client:
-        results = client.get_personen(search=query)
-        typer.echo(
-            json.dumps(
-                [r.model_dump(by_alias=True) for r in results],
-                indent=2,
-                ensure_ascii=False,
-            )
-        )
+    with FeuerONClient(
+        base_url, session_cache=DEFAULT_SESSION_CACHE, **kwargs
+    ) as client:
+        _echo_models(client.iter_personen(search=query), pretty)
 
 
 @api_app.command("erreichbarkeiten")
@@ -272,26 +336,18 @@ def api_erreichbarkeiten(
         "--base-url",
         help="FeuerON base URL.",
     ),
+    pretty: bool = typer.Option(
+        False, "--pretty", help="Print one indented JSON array instead of NDJSON."
+    ),
 ) -> None:
-    """Fetch contact details (Erreichbarkeiten) for a person."""
-    import json
+    """Fetch contact details (Erreichbarkeiten) for a person.
 
-    from rich.logging import RichHandler
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(message)s",
-        handlers=[RichHandler(rich_tracebacks=True, show_path=False)],
-    )
+    Prints one JSON object per line (NDJSON) unless ``--pretty`` is given.
+    """
+    _configure_logging()
 
     from scripts.feueron.api import FeuerONClient
+    from scripts.feueron.api.client import DEFAULT_SESSION_CACHE
 
-    with FeuerONClient(base_url) as client:
-        results = client.get_erreichbarkeiten(person_id)
-        typer.echo(
-            json.dumps(
-                [r.model_dump(by_alias=True) for r in results],
-                indent=2,
-                ensure_ascii=False,
-            )
-        )
+    with FeuerONClient(base_url, session_cache=DEFAULT_SESSION_CACHE) as client:
+        _echo_models(client.iter_erreichbarkeiten(person_id), pretty)
@@ -1,46 +1,62 @@
-"""FeuerON REST API client."""
+"""FeuerON REST API client.
 
-from scripts.feueron.api.client import FeuerONAPIError, FeuerONAuthError, FeuerONClient
-from scripts.feueron.api.einsatzdienst import EinsatzdienstMixin
-from scripts.feueron.api.feuerwehr import FeuerwehrMixin
-from scripts.feueron.api.finanzen import FinanzenMixin
-from scripts.feueron.api.models import (
-    Abteilung,
-    AbteilungValue,
-    Bankverbindung,
-    Beitrag,
-    ContextInfo,
-    CreateAbteilung,
-    CreateAbteilungEntry,
-    CreateAdresse,
-    CreateDienstgradEntry,
-    CreateBankverbindungEntry,
-    CreateBeitragEntry,
-    CreateErreichbarkeiten,
-    CreateGruppeEntry,
-    CreateOrganisation,
-    CreatePersonRequest,
-    Dienstgrad,
-    DienstgradLabel,
-    DienstgradValue,
-    Erreichbarkeit,
-    GeneralMenu,
-    Geschlecht,
-    Gruppe,
-    I18nText,
-    MenuItem,
-    Organisation,
-    OrganisationTree,
-    OrganisationTreeNode,
-    OrganisationsEbene,
-    Person,
-    PersonDetail,
-    UserSettings,
-    Verfahren,
-    Zahlungen,
-)
-from scripts.feueron.api.person import PersonMixin
-from scripts.feueron.api.reference import ReferenceMixin
+Names are resolved lazily (PEP 562) so that importing a submodule such as
+``scripts.feueron.api.models`` does not also load the client and every
+mixin.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scripts.feueron.api.client import (
+        FeuerONAPIError,
+        FeuerONAuthError,
+        FeuerONClient,
+    )
+    from scripts.feueron.api.einsatzdienst import EinsatzdienstMixin
+    from scripts.feueron.api.feuerwehr import FeuerwehrMixin
+    from scripts.feueron.api.finanzen import FinanzenMixin
+    from scripts.feueron.api.models import (
+        Abteilung,
+        AbteilungValue,
+        Bankverbindung,
+        Beitrag,
+        ContextInfo,
+        CreateAbteilung,
+        CreateAbteilungEntry,
+        CreateAdresse,
+        CreateDienstgradEntry,
+        CreateBankverbindungEntry,
+        CreateBeitragEntry,
+        CreateErreichbarkeiten,
+        CreateGruppeEntry,
+        CreateOrganisation,
+        CreatePersonRequest,
+        Dienstgrad,
+        DienstgradLabel,
+        DienstgradValue,
+        Erreichbarkeit,
+        GeneralMenu,
+        Geschlecht,
+        Gruppe,
+        I18nText,
+        MenuItem,
+        Organisation,
+        OrganisationTree,
+        OrganisationTreeNode,
+        OrganisationsEbene,
+        Person,
+        PersonBundle,
+        PersonDetail,
+        UserSettings,
+        Verfahren,
+        Zahlungen,
+    )
+    from scripts.feueron.api.person import PersonMixin
+    from scripts.feueron.api.reference import ReferenceMixin, iter_selectable_nodes
 
 __all__ = [
     "Abteilung",
@@ -78,10 +94,38 @@ __all__ = [
     "OrganisationTreeNode",
     "OrganisationsEbene",
     "Person",
+    "PersonBundle",
     "PersonDetail",
     "PersonMixin",
     "ReferenceMixin",
     "UserSettings",
     "Verfahren",
     "Zahlungen",
+    "iter_selectable_nodes",
 ]
+
+# Public names that do not live in ``models``, mapped to their submodule.
+_SUBMODULES = {
+    "FeuerONAPIError": "client",
+    "FeuerONAuthError": "client",
+    "FeuerONClient": "client",
+    "EinsatzdienstMixin": "einsatzdienst",
+    "FeuerwehrMixin": "feuerwehr",
+    "FinanzenMixin": "finanzen",
+    "PersonMixin": "person",
+    "ReferenceMixin": "reference",
+    "iter_selectable_nodes": "reference",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{_SUBMODULES.get(name, 'models')}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
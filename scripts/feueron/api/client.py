@@ -2,29 +2,49 @@
 
 from __future__ import annotations
 
-import json as _json
 import logging
+import os
 import re
-from typing import Any, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, TypeVar
 
-import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import from_json, to_json
 
 from scripts.feueron.api.einsatzdienst import EinsatzdienstMixin
 from scripts.feueron.api.feuerwehr import FeuerwehrMixin
 from scripts.feueron.api.finanzen import FinanzenMixin
-from scripts.feueron.api.models import ContextInfo
+from scripts.feueron.api.models import ContextInfo, PersonBundle, PersonDetail
 from scripts.feueron.api.person import PersonMixin
 from scripts.feueron.api.reference import ReferenceMixin
 from scripts.feueron.credentials import get_credentials
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_BASE_URL = "https://www.feueron.de/feueron"
 API_PREFIX = "/api"
+DEFAULT_SESSION_CACHE = Path.home() / ".cache" / "feueron" / "session.json"
+
+# Matched against the raw /csrfguard response bytes (see login()).
+_CSRF_RE = re.compile(rb"masterTokenValue\s*=\s*'([^']+)'")
 
 T = TypeVar("T", bound=BaseModel)
 
+# One list validator per model, built on first use.
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter[Any]] = {}
+
+
+def _list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """Return a cached ``TypeAdapter(list[model])``."""
+    adapter = _LIST_ADAPTERS.get(model)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[model] = TypeAdapter(list[model])
+    return adapter
+
 
 class FeuerONAuthError(Exception):
     """Raised when login fails or the session has expired."""
@@ -51,6 +71,10 @@ class FeuerONClient(
 
         with FeuerONClient() as client:
             results = client.get_personen(search="Müller")
+
+    If ``session_cache`` is given, the session cookies and CSRF token are
+    stored there after login and reused by the next client for the same
+    server and user, skipping the login round-trips while still valid.
     """
 
     def __init__(
@@ -62,6 +86,7 @@ class FeuerONClient(
         region_id: str | None = None,
         organisation_id: int | None = None,
         timeout: float = 30.0,
+        session_cache: Path | None = None,
     ) -> None:
         if username is None or password is None:
             env_user, env_pass, env_region = get_credentials()
@@ -74,11 +99,15 @@ class FeuerONClient(
         self._password = password
         self._region_id = region_id or "156"
         self._organisation_id = organisation_id
-        self._http = httpx.Client(
-            base_url=self._base_url,
-            timeout=timeout,
-            follow_redirects=True,
-        )
+        self._session_cache = session_cache
+        # The httpx client is created on first login() so that constructing
+        # a FeuerONClient (or aborting before login) does not import httpx.
+        self._http_kwargs: dict[str, Any] = {
+            "base_url": self._base_url,
+            "timeout": timeout,
+            "follow_redirects": True,
+        }
+        self._http: httpx.Client | None = None
         self._authenticated = False
 
     # -- context manager ---------------------------------------------------
@@ -91,12 +120,32 @@ class FeuerONClient(
         self.close()
 
     def close(self) -> None:
-        self._http.close()
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     # -- authentication ----------------------------------------------------
 
     def login(self) -> None:
         """Authenticate via the FeuerON login form."""
+        if self._http is None:
+            import httpx
+
+            # Migration runs issue hundreds of sequential API calls; keep
+            # one multiplexed HTTP/2 connection alive between them.
+            self._http = httpx.Client(
+                **self._http_kwargs,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60.0,
+                ),
+            )
+
+        if self._restore_session():
+            return
+
         # GET the login page first (pick up initial cookies)
         self._http.get("/")
 
@@ -127,17 +176,17 @@ class FeuerONClient(
         #   var masterTokenValue = 'XXXX-XXXX-XXXX-...';
         # This token must be sent as an OWASP-CSRFTOKEN header on API calls.
         cg = self._http.get("/csrfguard")
-        csrf_match = re.search(r"masterTokenValue\s*=\s*'([^']+)'", cg.text)
+        csrf_match = _CSRF_RE.search(cg.content)
         if csrf_match:
-            self._http.headers["OWASP-CSRFTOKEN"] = csrf_match.group(1)
+            self._http.headers["OWASP-CSRFTOKEN"] = csrf_match.group(1).decode()
             logger.info("CSRF token acquired")
         else:
             logger.warning("Could not obtain OWASP CSRF token")
 
         # Auto-discover the organisation ID from the session context.
         if self._organisation_id is None:
-            ctx = ContextInfo.model_validate(
-                self._http.get(f"{API_PREFIX}/context-info").json()
+            ctx = ContextInfo.model_validate_json(
+                self._http.get(f"{API_PREFIX}/context-info").content
             )
             self._organisation_id = int(ctx.organisation.id)
             logger.info(
@@ -148,6 +197,90 @@ class FeuerONClient(
 
         self._authenticated = True
         logger.info("Logged in to FeuerON as %s", self._username)
+        self._save_session()
+
+    # -- session cache -----------------------------------------------------
+
+    def _session_key(self) -> dict[str, str | None]:
+        """Identify the server and account a cached session belongs to."""
+        return {
+            "base_url": self._base_url,
+            "username": self._username,
+            "region_id": self._region_id,
+        }
+
+    def _restore_session(self) -> bool:
+        """Reuse the cached session if it belongs to us and is still valid."""
+        if self._session_cache is None or not self._session_cache.exists():
+            return False
+        try:
+            cached = from_json(self._session_cache.read_bytes())
+        except ValueError:
+            return False
+        if not isinstance(cached, dict) or cached.get("key") != self._session_key():
+            return False
+
+        try:
+            for cookie in cached.get("cookies", []):
+                self._http.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie["domain"],
+                    path=cookie["path"],
+                )
+            if cached.get("csrf_token"):
+                self._http.headers["OWASP-CSRFTOKEN"] = cached["csrf_token"]
+        except (KeyError, TypeError, AttributeError):
+            # Truncated, hand-edited or differently shaped cache: treat as a miss
+            self._clear_session()
+            return False
+
+        # One cheap request tells us whether the server still knows the
+        # session; an expired one ends in a 401 or the HTML login page.
+        self._authenticated = True
+        try:
+            ctx = self.get_context_info()
+        except (FeuerONAuthError, FeuerONAPIError, ValueError):
+            self._authenticated = False
+            self._clear_session()
+            logger.info("Cached FeuerON session expired, logging in again")
+            return False
+
+        if self._organisation_id is None:
+            self._organisation_id = int(ctx.organisation.id)
+        logger.info("Reusing cached FeuerON session for %s", self._username)
+        return True
+
+    def _clear_session(self) -> None:
+        """Drop any cookies and CSRF token restored from the session cache."""
+        self._http.cookies.clear()
+        self._http.headers.pop("OWASP-CSRFTOKEN", None)
+
+    def _save_session(self) -> None:
+        """Write the session cookies and CSRF token to the session cache."""
+        if self._session_cache is None:
+            return
+        payload = {
+            "key": self._session_key(),
+            "cookies": [
+                {
+                    "name": c.name,
+                    "value": c.value,
+                    "domain": c.domain,
+                    "path": c.path,
+                }
+                for c in self._http.cookies.jar
+            ],
+            "csrf_token": self._http.headers.get("OWASP-CSRFTOKEN"),
+        }
+        # The cookies grant access to personal data — keep the file private.
+        # The open() mode only applies on creation, so tighten an existing
+        # file explicitly.
+        self._session_cache.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(self._session_cache, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(to_json(payload))
 
     # -- low-level request helpers -----------------------------------------
 
@@ -156,8 +289,15 @@ class FeuerONClient(
         "Accept": "application/json, text/plain, */*",
     }
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
-        """Make an authenticated API request."""
+    def _request(
+        self, method: str, path: str, *, raise_for_status: bool = True, **kwargs: Any
+    ) -> httpx.Response:
+        """Make an authenticated API request.
+
+        Error statuses raise ``FeuerONAPIError`` unless *raise_for_status*
+        is false, in which case the caller inspects ``status_code`` itself.
+        An expired session (401) always raises ``FeuerONAuthError``.
+        """
         if not self._authenticated:
             raise FeuerONAuthError("Not authenticated — call login() first")
 
@@ -169,22 +309,51 @@ class FeuerONClient(
         if response.status_code == 401:
             self._authenticated = False
             raise FeuerONAuthError("Session expired")
-        if response.status_code >= 400:
+        if raise_for_status and response.status_code >= 400:
             raise FeuerONAPIError(response.status_code, response.text[:500])
 
         return response
 
     def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """GET an API endpoint and return parsed JSON."""
-        return self._request("GET", path, params=params).json()
+        return from_json(self._request("GET", path, params=params).content)
 
     def _get_list(self, path: str, model: type[T], **kwargs: Any) -> list[T]:
-        """GET an API endpoint and return a list of typed models."""
-        return [model.model_validate(item) for item in self._get_json(path, **kwargs)]
+        """GET an API endpoint and return a list of typed models.
+
+        The raw body is handed to pydantic-core, which parses and validates
+        in one pass without building an intermediate Python list of dicts.
+        """
+        resp = self._request("GET", path, **kwargs)
+        return _list_adapter(model).validate_json(resp.content)
+
+    def _iter_list(self, path: str, model: type[T], **kwargs: Any) -> Iterator[T]:
+        """GET an API endpoint and yield typed models one at a time.
+
+        Unlike ``_get_list``, validated models are not collected, so callers
+        that filter and discard keep only the raw JSON list in memory.
+        """
+        for item in self._get_json(path, **kwargs):
+            yield model.model_validate(item)
 
     def _get_object(self, path: str, model: type[T], **kwargs: Any) -> T:
         """GET an API endpoint and return a single typed model."""
-        return model.model_validate(self._get_json(path, **kwargs))
+        return model.model_validate_json(self._request("GET", path, **kwargs).content)
+
+    def _send_model(
+        self, method: str, path: str, body: BaseModel, **dump_kwargs: Any
+    ) -> httpx.Response:
+        """Send *body* as JSON, serialized in one pass by pydantic.
+
+        ``dump_kwargs`` are passed to ``model_dump_json`` alongside
+        ``by_alias=True``.
+        """
+        return self._request(
+            method,
+            path,
+            content=body.model_dump_json(by_alias=True, **dump_kwargs),
+            headers={"Content-Type": "application/json"},
+        )
 
     def _post_text(self, path: str, **kwargs: Any) -> str:
         """POST to an API endpoint and return the response as plain text."""
@@ -200,10 +369,23 @@ class FeuerONClient(
         resp = self._request(
             "PATCH",
             path,
-            content=_json.dumps(operations),
+            content=to_json(operations),
+            headers={"Content-Type": "application/json-patch+json"},
+        )
+        return _list_adapter(model).validate_json(resp.content)
+
+    def _patch_noresult(self, path: str, operations: list[dict[str, Any]]) -> None:
+        """Send a JSON Patch request and discard the response body.
+
+        Used by the ``delete_*`` methods unless *return_result* is set, so
+        the remaining entries are only parsed when a caller reads them.
+        """
+        self._request(
+            "PATCH",
+            path,
+            content=to_json(operations),
             headers={"Content-Type": "application/json-patch+json"},
         )
-        return [model.model_validate(item) for item in resp.json()]
 
     # -- API methods -------------------------------------------------------
 
@@ -217,3 +399,36 @@ class FeuerONClient(
     def get_context_info(self) -> ContextInfo:
         """Return session context (user, organisation, settings)."""
         return self._get_object("/context-info", ContextInfo)
+
+    def get_all_subresources(self, person_id: int | str) -> PersonBundle:
+        """Fetch every per-person sub-resource concurrently.
+
+        The six GETs are independent, so they run in a small thread pool
+        and share the client's HTTP/2 connection instead of taking six
+        sequential round-trips.
+        """
+        fetchers = {
+            "abteilungen": self.get_abteilungen,
+            "dienstgrade": self.get_dienstgrade,
+            "gruppen": self.get_gruppen,
+            "bankverbindungen": self.get_bankverbindungen,
+            "beitraege": self.get_beitraege,
+            "erreichbarkeiten": self.get_erreichbarkeiten,
+        }
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as pool:
+            futures = {
+                name: pool.submit(fetch, person_id) for name, fetch in fetchers.items()
+            }
+            return PersonBundle(**{name: f.result() for name, f in futures.items()})
+
+    def get_persons_detail(
+        self, person_ids: Iterable[int | str], max_workers: int = 16
+    ) -> list[PersonDetail]:
+        """Fetch full detail for several persons concurrently.
+
+        Results are returned in the order of *person_ids*.  At most
+        *max_workers* requests are in flight at once over the shared
+        HTTP/2 connection.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.get_person, person_ids))
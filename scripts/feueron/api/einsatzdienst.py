@@ -2,45 +2,95 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Literal, overload
 
 from scripts.feueron.api.models import (
     CreateGruppeEntry,
     Gruppe,
 )
+from scripts.feueron.api.paths import PERSON_SUBPATHS
+from scripts.feueron.api.protocol import ClientProtocol
 
-if TYPE_CHECKING:
-    from scripts.feueron.api.client import FeuerONClient
 
-
-class EinsatzdienstMixin:
+class EinsatzdienstMixin(ClientProtocol):
     """API methods for the Einsatzdienst top-level tab."""
 
-    self: FeuerONClient
-
     # -- Züge/Gruppen ------------------------------------------------------
 
     def get_gruppen(self, person_id: int | str) -> list[Gruppe]:
         """Return Züge/Gruppen assignments for a person."""
-        return self._get_list(f"/personen/{person_id}/gruppen", Gruppe)
+        return self._get_list(PERSON_SUBPATHS["gruppen"].format(person_id), Gruppe)
 
     def create_gruppe(
         self, person_id: int | str, entry: CreateGruppeEntry
     ) -> Gruppe:
         """Create a Zug/Gruppe assignment via ``POST /api/personen/{id}/gruppen``."""
-        resp = self._request(
+        resp = self._send_model(
             "POST",
-            f"/personen/{person_id}/gruppen",
-            json=entry.model_dump(by_alias=True),
+            PERSON_SUBPATHS["gruppen"].format(person_id),
+            entry,
         )
-        return Gruppe.model_validate(resp.json())
+        return Gruppe.model_validate_json(resp.content)
+
+    @overload
+    def delete_gruppen(
+        self,
+        person_id: int | str,
+        gruppe_ids: list[int | str],
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_gruppen(
+        self,
+        person_id: int | str,
+        gruppe_ids: list[int | str],
+        return_result: Literal[True],
+    ) -> list[Gruppe]: ...
+
+    @overload
+    def delete_gruppen(
+        self,
+        person_id: int | str,
+        gruppe_ids: list[int | str],
+        return_result: bool,
+    ) -> list[Gruppe] | None: ...
+
+    def delete_gruppen(
+        self,
+        person_id: int | str,
+        gruppe_ids: list[int | str],
+        return_result: bool = False,
+    ) -> list[Gruppe] | None:
+        """Remove one or more Zug/Gruppe assignments."""
+        ops = [{"op": "remove", "path": f"/{gid}"} for gid in gruppe_ids]
+        path = PERSON_SUBPATHS["gruppen"].format(person_id)
+        if not return_result:
+            self._patch_noresult(path, ops)
+            return None
+        return self._patch(path, ops, Gruppe)
 
+    @overload
     def delete_gruppe(
-        self, person_id: int | str, gruppe_id: int | str
-    ) -> list[Gruppe]:
+        self,
+        person_id: int | str,
+        gruppe_id: int | str,
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_gruppe(
+        self,
+        person_id: int | str,
+        gruppe_id: int | str,
+        return_result: Literal[True],
+    ) -> list[Gruppe]: ...
+
+    def delete_gruppe(
+        self,
+        person_id: int | str,
+        gruppe_id: int | str,
+        return_result: bool = False,
+    ) -> list[Gruppe] | None:
         """Remove a Zug/Gruppe assignment."""
-        return self._patch(
-            f"/personen/{person_id}/gruppen",
-            [{"op": "remove", "path": f"/{gruppe_id}"}],
-            Gruppe,
-        )
+        return self.delete_gruppen(person_id, [gruppe_id], return_result)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Literal, overload
 
 from scripts.feueron.api.models import (
     Abteilung,
@@ -10,77 +10,185 @@ from scripts.feueron.api.models import (
     CreateDienstgradEntry,
     Dienstgrad,
 )
+from scripts.feueron.api.paths import PERSON_SUBPATHS
+from scripts.feueron.api.protocol import ClientProtocol
 
-if TYPE_CHECKING:
-    from scripts.feueron.api.client import FeuerONClient
 
-
-class FeuerwehrMixin:
+class FeuerwehrMixin(ClientProtocol):
     """API methods for the Feuerwehr top-level tab."""
 
-    self: FeuerONClient
-
     # -- Abteilungen -----------------------------------------------------------
 
     def get_abteilungen(self, person_id: int | str) -> list[Abteilung]:
         """Return Abteilung memberships for a person."""
-        return self._get_list(f"/personen/{person_id}/abteilungen", Abteilung)
+        return self._get_list(
+            PERSON_SUBPATHS["abteilungen"].format(person_id), Abteilung
+        )
+
+    @overload
+    def delete_abteilungen(
+        self,
+        person_id: int | str,
+        abteilung_ids: list[int | str],
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_abteilungen(
+        self,
+        person_id: int | str,
+        abteilung_ids: list[int | str],
+        return_result: Literal[True],
+    ) -> list[Abteilung]: ...
+
+    @overload
+    def delete_abteilungen(
+        self,
+        person_id: int | str,
+        abteilung_ids: list[int | str],
+        return_result: bool,
+    ) -> list[Abteilung] | None: ...
+
+    def delete_abteilungen(
+        self,
+        person_id: int | str,
+        abteilung_ids: list[int | str],
+        return_result: bool = False,
+    ) -> list[Abteilung] | None:
+        """Remove one or more Abteilung memberships."""
+        ops = [{"op": "remove", "path": f"/{aid}"} for aid in abteilung_ids]
+        path = PERSON_SUBPATHS["abteilungen"].format(person_id)
+        if not return_result:
+            self._patch_noresult(path, ops)
+            return None
+        return self._patch(path, ops, Abteilung)
+
+    @overload
+    def delete_abteilung(
+        self,
+        person_id: int | str,
+        abteilung_id: int | str,
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_abteilung(
+        self,
+        person_id: int | str,
+        abteilung_id: int | str,
+        return_result: Literal[True],
+    ) -> list[Abteilung]: ...
 
     def delete_abteilung(
-        self, person_id: int | str, abteilung_id: int | str
-    ) -> list[Abteilung]:
+        self,
+        person_id: int | str,
+        abteilung_id: int | str,
+        return_result: bool = False,
+    ) -> list[Abteilung] | None:
         """Remove an Abteilung membership."""
-        return self._patch(
-            f"/personen/{person_id}/abteilungen",
-            [{"op": "remove", "path": f"/{abteilung_id}"}],
-            Abteilung,
-        )
+        return self.delete_abteilungen(person_id, [abteilung_id], return_result)
 
     def create_abteilung(
         self, person_id: int | str, entry: CreateAbteilungEntry
     ) -> Abteilung:
         """Create a new Abteilung membership via ``POST /api/personen/{id}/abteilungen``."""
-        resp = self._request(
+        resp = self._send_model(
             "POST",
-            f"/personen/{person_id}/abteilungen",
-            json=entry.model_dump(by_alias=True),
+            PERSON_SUBPATHS["abteilungen"].format(person_id),
+            entry,
         )
-        return Abteilung.model_validate(resp.json())
+        return Abteilung.model_validate_json(resp.content)
 
     # -- Dienstgrade -----------------------------------------------------------
 
     def get_dienstgrade(self, person_id: int | str) -> list[Dienstgrad]:
         """Return Dienstgrade for a person."""
-        return self._get_list(f"/personen/{person_id}/dienstgrade", Dienstgrad)
+        return self._get_list(
+            PERSON_SUBPATHS["dienstgrade"].format(person_id), Dienstgrad
+        )
+
+    @overload
+    def delete_dienstgrade(
+        self,
+        person_id: int | str,
+        dienstgrad_ids: list[int | str],
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_dienstgrade(
+        self,
+        person_id: int | str,
+        dienstgrad_ids: list[int | str],
+        return_result: Literal[True],
+    ) -> list[Dienstgrad]: ...
+
+    @overload
+    def delete_dienstgrade(
+        self,
+        person_id: int | str,
+        dienstgrad_ids: list[int | str],
+        return_result: bool,
+    ) -> list[Dienstgrad] | None: ...
+
+    def delete_dienstgrade(
+        self,
+        person_id: int | str,
+        dienstgrad_ids: list[int | str],
+        return_result: bool = False,
+    ) -> list[Dienstgrad] | None:
+        """Remove one or more Dienstgrad entries."""
+        ops = [{"op": "remove", "path": f"/{did}"} for did in dienstgrad_ids]
+        path = PERSON_SUBPATHS["dienstgrade"].format(person_id)
+        if not return_result:
+            self._patch_noresult(path, ops)
+            return None
+        return self._patch(path, ops, Dienstgrad)
+
+    @overload
+    def delete_dienstgrad(
+        self,
+        person_id: int | str,
+        dienstgrad_id: int | str,
+        return_result: Literal[False] = ...,
+    ) -> None: ...
 
+    @overload
     def delete_dienstgrad(
-        self, person_id: int | str, dienstgrad_id: int | str
-    ) -> list[Dienstgrad]:
+        self,
+        person_id: int | str,
+        dienstgrad_id: int | str,
+        return_result: Literal[True],
+    ) -> list[Dienstgrad]: ...
+
+    def delete_dienstgrad(
+        self,
+        person_id: int | str,
+        dienstgrad_id: int | str,
+        return_result: bool = False,
+    ) -> list[Dienstgrad] | None:
         """Remove a Dienstgrad entry."""
-        return self._patch(
-            f"/personen/{person_id}/dienstgrade",
-            [{"op": "remove", "path": f"/{dienstgrad_id}"}],
-            Dienstgrad,
-        )
+        return self.delete_dienstgrade(person_id, [dienstgrad_id], return_result)
 
     def create_dienstgrad(
         self, person_id: int | str, entry: CreateDienstgradEntry
     ) -> Dienstgrad:
         """Create a new Dienstgrad via ``POST /api/personen/{id}/dienstgrade``."""
-        resp = self._request(
+        resp = self._send_model(
             "POST",
-            f"/personen/{person_id}/dienstgrade",
-            json=entry.model_dump(by_alias=True),
+            PERSON_SUBPATHS["dienstgrade"].format(person_id),
+            entry,
         )
-        return Dienstgrad.model_validate(resp.json())
+        return Dienstgrad.model_validate_json(resp.content)
 
     def update_dienstgrad(
         self, person_id: int | str, dienstgrad: Dienstgrad
     ) -> Dienstgrad:
         """Update a Dienstgrad via ``PATCH /api/personen/{id}/dienstgrade/{dgId}``."""
-        resp = self._request(
+        resp = self._send_model(
             "PATCH",
             f"/personen/{person_id}/dienstgrade/{dienstgrad.id}",
-            json=dienstgrad.model_dump(by_alias=True, exclude_unset=True),
+            dienstgrad,
+            exclude_unset=True,
         )
-        return Dienstgrad.model_validate(resp.json())
+        return Dienstgrad.model_validate_json(resp.content)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Literal, overload
 
 from scripts.feueron.api.models import (
     Bankverbindung,
@@ -10,61 +10,94 @@ from scripts.feueron.api.models import (
     CreateBankverbindungEntry,
     CreateBeitragEntry,
 )
+from scripts.feueron.api.paths import PERSON_SUBPATHS
+from scripts.feueron.api.protocol import ClientProtocol
 
-if TYPE_CHECKING:
-    from scripts.feueron.api.client import FeuerONClient
+# Query-string spelling of booleans expected by the API.
+_BOOL_STR: dict[bool, str] = {True: "true", False: "false"}
 
 
-class FinanzenMixin:
+class FinanzenMixin(ClientProtocol):
     """API methods for the Finanzen top-level tab."""
 
-    self: FeuerONClient
-
     def get_bankverbindungen(self, person_id: int | str) -> list[Bankverbindung]:
         """Return bank details for a person."""
-        return self._get_list(f"/personen/{person_id}/bankverbindungen", Bankverbindung)
+        return self._get_list(
+            PERSON_SUBPATHS["bankverbindungen"].format(person_id), Bankverbindung
+        )
+
+    @overload
+    def delete_bankverbindungen(
+        self,
+        person_id: int | str,
+        bankverbindung_ids: list[int | str],
+        return_result: Literal[False] = ...,
+    ) -> None: ...
+
+    @overload
+    def delete_bankverbindungen(
+        self,
+        person_id: int | str,
+        bankverbindung_ids: list[int | str],
+        return_result: Literal[True],
+    ) -> list[Bankverbindung]: ...
 
+    @overload
     def delete_bankverbindungen(
-        self, person_id: int | str, bankverbindung_ids: list[int | str]
-    ) -> list[Bankverbindung]:
+        self,
+        person_id: int | str,
+        bankverbindung_ids: list[int | str],
+        return_result: bool,
+    ) -> list[Bankverbindung] | None: ...
+
+    def delete_bankverbindungen(
+        self,
+        person_id: int | str,
+        bankverbindung_ids: list[int | str],
+        return_result: bool = False,
+    ) -> list[Bankverbindung] | None:
         """Remove one or more Bankverbindungen entries."""
         ops = [{"op": "remove", "path": f"/{bid}"} for bid in bankverbindung_ids]
-        return self._patch(
-            f"/personen/{person_id}/bankverbindungen", ops, Bankverbindung
-        )
+        path = PERSON_SUBPATHS["bankverbindungen"].format(person_id)
+        if not return_result:
+            self._patch_noresult(path, ops)
+            return None
+        return self._patch(path, ops, Bankverbindung)
 
     def create_bankverbindung(
         self, person_id: int | str, entry: CreateBankverbindungEntry
     ) -> Bankverbindung:
         """Create a Bankverbindung via ``POST /api/personen/{id}/bankverbindungen``."""
-        resp = self._request(
+        resp = self._send_model(
             "POST",
-            f"/personen/{person_id}/bankverbindungen",
-            json=entry.model_dump(by_alias=True, exclude_unset=True),
+            PERSON_SUBPATHS["bankverbindungen"].format(person_id),
+            entry,
+            exclude_unset=True,
         )
-        return Bankverbindung.model_validate(resp.json())
+        return Bankverbindung.model_validate_json(resp.content)
 
     def update_bankverbindung(
         self, person_id: int | str, bankverbindung: Bankverbindung
     ) -> Bankverbindung:
         """Update a Bankverbindung via ``PATCH /api/personen/{id}/bankverbindungen/{bvId}``."""
-        resp = self._request(
+        resp = self._send_model(
             "PATCH",
             f"/personen/{person_id}/bankverbindungen/{bankverbindung.id}",
-            json=bankverbindung.model_dump(by_alias=True, exclude_unset=True),
+            bankverbindung,
+            exclude_unset=True,
         )
-        return Bankverbindung.model_validate(resp.json())
+        return Bankverbindung.model_validate_json(resp.content)
 
     def create_beitrag(
         self, person_id: int | str, entry: CreateBeitragEntry
     ) -> Beitrag:
         """Create a Beitrag via ``POST /api/personen/{id}/beitraege``."""
-        resp = self._request(
+        resp = self._send_model(
             "POST",
-            f"/personen/{person_id}/beitraege",
-            json=entry.model_dump(by_alias=True),
+            PERSON_SUBPATHS["beitraege"].format(person_id),
+            entry,
         )
-        return Beitrag.model_validate(resp.json())
+        return Beitrag.model_validate_json(resp.content)
 
     def get_beitraege(
         self,
@@ -75,10 +108,10 @@ class FinanzenMixin:
     ) -> list[Beitrag]:
         """Return Beiträge (fees/contributions) for a person."""
         return self._get_list(
-            f"/personen/{person_id}/beitraege",
+            PERSON_SUBPATHS["beitraege"].format(person_id),
             Beitrag,
             params={
-                "hideInactive": str(hide_inactive).lower(),
-                "hideOutdated": str(hide_outdated).lower(),
+                "hideInactive": _BOOL_STR[hide_inactive],
+                "hideOutdated": _BOOL_STR[hide_outdated],
             },
         )
@@ -2,47 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Any, Literal
+import functools
+import types
+from typing import Any, Literal, TypeVar, Union, get_args, get_origin
 
 from pydantic import BaseModel, Field
+from pydantic.alias_generators import to_camel
+
+M = TypeVar("M", bound=BaseModel)
 
 # UI: Männlich=MALE, Weiblich=FEMALE, Divers=OTHER, Juristisch=LEGAL_ENTITY
 Geschlecht = Literal["MALE", "FEMALE", "OTHER", "LEGAL_ENTITY"]
 
 
-class Organisation(BaseModel):
+class CamelModel(BaseModel):
+    """Base for models whose JSON keys are the camelCase field names."""
+
+    model_config = {"alias_generator": to_camel}
+
+
+class Organisation(CamelModel):
     """Organisation (Feuerwehr) as returned by the API."""
 
     id: str
     name: str
-    legacy_fwk: str | None = Field(None, alias="legacyFwk")
-    organisations_ebene: str | None = Field(None, alias="organisationsEbene")
-    organisations_typ: str | None = Field(None, alias="organisationsTyp")
+    legacy_fwk: str | None = None
+    organisations_ebene: str | None = None
+    organisations_typ: str | None = None
 
 
-class UserSettings(BaseModel):
+class UserSettings(CamelModel):
     """User export settings from ``/api/context-info``."""
 
-    export_charset: str = Field("UTF-8", alias="exportCharset")
-    csv_field_separator: str = Field(";", alias="csvFieldSeparator")
-    csv_text_qualifier: str = Field('"', alias="csvTextQualifier")
+    export_charset: str = "UTF-8"
+    csv_field_separator: str = ";"
+    csv_text_qualifier: str = '"'
 
 
-class ContextInfo(BaseModel):
+class ContextInfo(CamelModel):
     """Session context from ``/api/context-info``."""
 
-    user_id: str = Field(alias="userId")
+    user_id: str
     username: str
-    user_realname: str = Field(alias="userRealname")
+    user_realname: str
     organisation: Organisation
-    default_organisation_id_for_entity_creation: str = Field(
-        alias="defaultOrganisationIdForEntityCreation"
-    )
-    default_bundesland: str = Field(alias="defaultBundesland")
-    user_settings: UserSettings = Field(alias="userSettings")
+    default_organisation_id_for_entity_creation: str
+    default_bundesland: str
+    user_settings: UserSettings
 
 
-class Person(BaseModel):
+class Person(CamelModel):
     """Person search result from ``/api/personen``."""
 
     id: str
@@ -50,68 +59,94 @@ class Person(BaseModel):
     vorname: str
     nachname: str
     geburtsdatum: str | None = None
-    geschlecht: Geschlecht | None = None
+    # A Geschlecht value; not re-checked on responses the server produced.
+    geschlecht: str | None = None
     organisation: Organisation | None = None
-    zweit_organisation: Organisation | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: Organisation | None = None
 
 
-class AbteilungValue(BaseModel):
+class AbteilungValue(CamelModel):
     """Abteilung option from ``/api/personen/abteilungen-values``."""
 
     type: str
     name: str
 
+    model_config = {"frozen": True}
 
-class OrganisationsEbene(BaseModel):
+
+class OrganisationsEbene(CamelModel):
     """Organisation level within the tree."""
 
     id: str
     name: str
 
+    model_config = {"frozen": True}
+
 
-class OrganisationTreeNode(BaseModel):
+class OrganisationTreeNode(CamelModel):
     """Node in the organisation tree from ``/api/organisationen-tree``."""
 
-    organisation_id: str | None = Field(None, alias="organisationId")
+    organisation_id: str | None = None
     bezeichnung: str | None = None
-    legacy_fwk: str | None = Field(None, alias="legacyFwk")
-    legacy_fwk_tree_leaf: bool | None = Field(None, alias="legacyFwkTreeLeaf")
-    organisations_ebene: OrganisationsEbene | None = Field(
-        None, alias="organisationsEbene"
-    )
+    legacy_fwk: str | None = None
+    legacy_fwk_tree_leaf: bool | None = None
+    organisations_ebene: OrganisationsEbene | None = None
     selectable: bool = False
-    children: list[OrganisationTreeNode] = []
+    children: list[OrganisationTreeNode] = Field(default_factory=list)
+
+    # Self-referential: build the validator on first use, not at import.
+    model_config = {"defer_build": True}
 
 
-class OrganisationTree(BaseModel):
+class OrganisationTree(CamelModel):
     """Root of the organisation tree response."""
 
-    children: list[OrganisationTreeNode] = []
+    children: list[OrganisationTreeNode] = Field(default_factory=list)
     selectable: bool = False
 
+    model_config = {"defer_build": True}
+
+    @functools.cached_property
+    def by_organisation_id(self) -> dict[str, OrganisationTreeNode]:
+        """Every node in the tree keyed by ``organisation_id``.
+
+        Built on first access with an explicit stack, so deep trees do not
+        hit the recursion limit.  The index is a snapshot: after changing
+        ``children`` anywhere in the tree, ``del tree.by_organisation_id``
+        to have it rebuilt on the next access.
+        """
+        index: dict[str, OrganisationTreeNode] = {}
+        stack = list(self.children)
+        while stack:
+            node = stack.pop()
+            if node.organisation_id is not None:
+                index[node.organisation_id] = node
+            stack.extend(node.children)
+        return index
+
 
 # -- person creation request models ----------------------------------------
 
 
-class CreateAbteilung(BaseModel):
+class CreateAbteilung(CamelModel):
     """Abteilung membership in a person creation request."""
 
     name: str
-    mitglied_seit: str = Field(alias="mitgliedSeit")
+    mitglied_seit: str
 
     model_config = {"populate_by_name": True}
 
 
-class CreateOrganisation(BaseModel):
+class CreateOrganisation(CamelModel):
     """Organisation block in a person creation request."""
 
     id: str
-    abteilungen: list[CreateAbteilung] = []
+    abteilungen: list[CreateAbteilung] = Field(default_factory=list)
 
     model_config = {"populate_by_name": True}
 
 
-class CreateAbteilungEntry(BaseModel):
+class CreateAbteilungEntry(CamelModel):
     """Request body for ``POST /api/personen/{id}/abteilungen``."""
 
     abteilung: str
@@ -119,15 +154,13 @@ class CreateAbteilungEntry(BaseModel):
     bis: str = ""
     organisation: CreateOrganisation
     bundesland: str = "Niedersachsen"
-    organisation_ausserhalb_von_land: bool = Field(
-        False, alias="organisationAusserhalbVonLand"
-    )
-    nicht_in_statistik_auswerten: bool = Field(False, alias="nichtInStatistikAuswerten")
+    organisation_ausserhalb_von_land: bool = False
+    nicht_in_statistik_auswerten: bool = False
 
     model_config = {"populate_by_name": True}
 
 
-class CreateAdresse(BaseModel):
+class CreateAdresse(CamelModel):
     """Address block in a person creation request."""
 
     strasse: str = ""
@@ -139,22 +172,22 @@ class CreateAdresse(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CreateErreichbarkeiten(BaseModel):
+class CreateErreichbarkeiten(CamelModel):
     """Flat contact details in a person creation request."""
 
-    telefon_privat: str = Field("", alias="telefonPrivat")
-    telefon_dienstlich: str = Field("", alias="telefonDienstlich")
-    mobil_privat: str = Field("", alias="mobilPrivat")
-    mobil_dienstlich: str = Field("", alias="mobilDienstlich")
-    email_privat: str = Field("", alias="emailPrivat")
-    email_dienstlich: str = Field("", alias="emailDienstlich")
-    telefax_privat: str = Field("", alias="telefaxPrivat")
-    telefax_dienstlich: str = Field("", alias="telefaxDienstlich")
+    telefon_privat: str = ""
+    telefon_dienstlich: str = ""
+    mobil_privat: str = ""
+    mobil_dienstlich: str = ""
+    email_privat: str = ""
+    email_dienstlich: str = ""
+    telefax_privat: str = ""
+    telefax_dienstlich: str = ""
 
     model_config = {"populate_by_name": True}
 
 
-class CreatePersonRequest(BaseModel):
+class CreatePersonRequest(CamelModel):
     """Request body for ``POST /api/personen``."""
 
     nachname: str
@@ -174,27 +207,27 @@ class CreatePersonRequest(BaseModel):
 # -- person creation response models --------------------------------------
 
 
-class ResponseAbteilung(BaseModel):
+class ResponseAbteilung(CamelModel):
     """Abteilung in a created person response."""
 
     id: str
     name: str
-    mitglied_seit: str = Field(alias="mitgliedSeit")
+    mitglied_seit: str
 
 
-class ResponseOrganisation(BaseModel):
+class ResponseOrganisation(CamelModel):
     """Organisation in a created person response."""
 
     id: str
     name: str
-    legacy_fwk: str | None = Field(None, alias="legacyFwk")
-    organisations_ebene: str | None = Field(None, alias="organisationsEbene")
-    organisations_typ: str | None = Field(None, alias="organisationsTyp")
-    abteilungen: list[ResponseAbteilung] = []
-    parent_id: str | None = Field(None, alias="parentId")
+    legacy_fwk: str | None = None
+    organisations_ebene: str | None = None
+    organisations_typ: str | None = None
+    abteilungen: list[ResponseAbteilung] = Field(default_factory=list)
+    parent_id: str | None = None
 
 
-class ResponseAdresse(BaseModel):
+class ResponseAdresse(CamelModel):
     """Address in a created person response."""
 
     strasse: str | None = None
@@ -205,61 +238,54 @@ class ResponseAdresse(BaseModel):
     land: str | None = None
 
 
-class ResponseFeuerwehr(BaseModel):
+class ResponseFeuerwehr(CamelModel):
     """Feuerwehr-specific fields in a created person response."""
 
     dienstgrad: str | None = None
     dienststellung: str | None = None
     einsatzfahrer: str | None = None
-    nicht_in_personalstatistik_beruecksichtigen: bool = Field(
-        False, alias="nichtInPersonalstatistikBeruecksichtigen"
-    )
-    fuer_einsaetze_der_gesamten_stadt_gemeinde_sichtbar: bool = Field(
-        False, alias="fuerEinsaetzeDerGesamtenStadtGemeindeSichtbar"
-    )
-    datenweitergabe_widersprochen: bool = Field(
-        False, alias="datenweitergabeWidersprochen"
-    )
-
-
-class ChangeInfo(BaseModel):
+    nicht_in_personalstatistik_beruecksichtigen: bool = False
+    fuer_einsaetze_der_gesamten_stadt_gemeinde_sichtbar: bool = False
+    datenweitergabe_widersprochen: bool = False
+
+
+class ChangeInfo(CamelModel):
     """Created/last-changed metadata."""
 
-    editor_full_name: str | None = Field(None, alias="editorFullName")
+    editor_full_name: str | None = None
     date: str | None = None
 
 
-class PersonDetail(BaseModel):
+class PersonDetail(CamelModel):
     """Full person detail returned by ``POST /api/personen`` (create)."""
 
     id: str
     personalnummer: str
     vorname: str
     nachname: str
-    geschlecht: Geschlecht | None = None
+    # A Geschlecht value; not re-checked on responses the server produced.
+    geschlecht: str | None = None
     geburtsort: str | None = None
     geburtsname: str | None = None
     geburtsdatum: str | None = None
     erreichbarkeiten: CreateErreichbarkeiten | None = None
     feuerwehr: ResponseFeuerwehr | None = None
     organisation: ResponseOrganisation | None = None
-    zweit_organisation: ResponseOrganisation | None = Field(
-        None, alias="zweitOrganisation"
-    )
+    zweit_organisation: ResponseOrganisation | None = None
     adresse: ResponseAdresse | None = None
-    einstellungs_datum: str | None = Field(None, alias="einstellungsDatum")
-    ausgetreten_am: str | None = Field(None, alias="ausgetretenAm")
+    einstellungs_datum: str | None = None
+    ausgetreten_am: str | None = None
     austrittsgrund: str | None = None
-    spind_nr: str | None = Field(None, alias="spindNr")
+    spind_nr: str | None = None
     anrede: str | None = None
     brieftitel: str | None = None
     familienstand: str | None = None
-    anzahl_kinder: int | None = Field(None, alias="anzahlKinder")
+    anzahl_kinder: int | None = None
     staatsangehoerigkeit: str | None = None
     blutgruppe: str | None = None
     created: ChangeInfo | None = None
-    last_changed: ChangeInfo | None = Field(None, alias="lastChanged")
-    antrago_token: str | None = Field(None, alias="antragoToken")
+    last_changed: ChangeInfo | None = None
+    antrago_token: str | None = None
 
     model_config = {"populate_by_name": True}
 
@@ -268,35 +294,50 @@ class PersonDetail(BaseModel):
 
 
 class I18nText(BaseModel):
-    """Internationalised text value."""
+    """Internationalised text value.
+
+    Only the German text is kept; the server's other locales (``en_GB``,
+    ``it_IT``) are ignored when parsing.
+    """
 
     de_DE: str | None = None
-    en_GB: str | None = None
-    it_IT: str | None = None
 
+    model_config = {"frozen": True}
 
-class MenuItem(BaseModel):
+
+class MenuItem(CamelModel):
     """Single item within a GeneralMenu."""
 
     id: str
     value: I18nText
-    sort_id: int = Field(0, alias="sortId")
+    sort_id: int = 0
+
+    model_config = {"frozen": True}
 
 
-class GeneralMenu(BaseModel):
+class GeneralMenu(CamelModel):
     """Named menu from ``/api/personen/general-menus``."""
 
     name: str
-    items: list[MenuItem] = []
+    items: list[MenuItem] = Field(default_factory=list)
+
+    @functools.cached_property
+    def by_id(self) -> dict[str, MenuItem]:
+        """Items keyed by ID, built on first access.
 
+        The index is a snapshot of ``items``: after changing the list,
+        ``del menu.by_id`` to have it rebuilt on the next access.
+        """
+        return {item.id: item for item in self.items}
 
-class DienstgradLabel(BaseModel):
+
+class DienstgradLabel(CamelModel):
     """Bezeichnung and short form for a single gender variant."""
 
     bezeichnung: I18nText = Field(default_factory=I18nText)
-    bezeichnung_kurz: I18nText = Field(
-        default_factory=I18nText, alias="bezeichnungKurz"
-    )
+    bezeichnung_kurz: I18nText = Field(default_factory=I18nText)
+
+    model_config = {"frozen": True}
 
 
 class DienstgradValue(BaseModel):
@@ -306,28 +347,30 @@ class DienstgradValue(BaseModel):
     FEMALE: DienstgradLabel = Field(default_factory=DienstgradLabel)
     LEGAL_ENTITY: DienstgradLabel = Field(default_factory=DienstgradLabel)
 
+    model_config = {"frozen": True}
+
 
 # -- per-person sub-resource models ----------------------------------------
 
 
-class Dienstgrad(BaseModel):
+class Dienstgrad(CamelModel):
     """Dienstgrad entry from ``/api/personen/{id}/dienstgrade``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     bezeichnung: str
-    bezeichnung_kurz: str | None = Field(None, alias="bezeichnungKurz")
+    bezeichnung_kurz: str | None = None
     von: str
     bis: str | None = None
     ort: str | None = None
     befoerderungsgrund1: str | None = None
     befoerderungsgrund2: str | None = None
-    person_dokumente: list[Any] = Field(default_factory=list, alias="personDokumente")
+    person_dokumente: list[Any] = Field(default_factory=list)
 
     model_config = {"populate_by_name": True}
 
 
-class CreateDienstgradEntry(BaseModel):
+class CreateDienstgradEntry(CamelModel):
     """Request body for ``POST /api/personen/{id}/dienstgrade``."""
 
     bezeichnung: str
@@ -335,11 +378,11 @@ class CreateDienstgradEntry(BaseModel):
     bis: str = ""
 
 
-class Gruppe(BaseModel):
+class Gruppe(CamelModel):
     """Zug/Gruppe entry from ``/api/personen/{id}/gruppen``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     bezeichnung: str
     von: str
     bis: str | None = None
@@ -348,7 +391,7 @@ class Gruppe(BaseModel):
     funktion2: str | None = None
 
 
-class CreateGruppeEntry(BaseModel):
+class CreateGruppeEntry(CamelModel):
     """Request body for ``POST /api/personen/{id}/gruppen``."""
 
     bezeichnung: str
@@ -361,60 +404,54 @@ class CreateGruppeEntry(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class Abteilung(BaseModel):
+class Abteilung(CamelModel):
     """Abteilung membership from ``/api/personen/{id}/abteilungen``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     abteilung: str
     von: str
     bis: str | None = None
-    organisation_ausserhalb_von_land: bool = Field(
-        False, alias="organisationAusserhalbVonLand"
-    )
+    organisation_ausserhalb_von_land: bool = False
     bundesland: str | None = None
-    instanzfremde_organisation_name: str | None = Field(
-        None, alias="instanzfremdeOrganisationName"
-    )
+    instanzfremde_organisation_name: str | None = None
     organisation: Organisation | None = None
     austrittsgrund: str | None = None
-    nicht_in_statistik_auswerten: bool = Field(False, alias="nichtInStatistikAuswerten")
-    naehere_informationen1: str | None = Field(None, alias="naehereInformationen1")
-    naehere_informationen2: str | None = Field(None, alias="naehereInformationen2")
-
-    model_config = {"populate_by_name": True}
+    nicht_in_statistik_auswerten: bool = False
+    naehere_informationen1: str | None = None
+    naehere_informationen2: str | None = None
 
 
-class Erreichbarkeit(BaseModel):
+class Erreichbarkeit(CamelModel):
     """Contact detail entry from ``/api/personen/{id}/erreichbarkeiten``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     art: str
     kontaktdaten: str
     erreichbarkeit1: str | None = None
     erreichbarkeit2: str | None = None
 
 
-class Verfahren(BaseModel):
+class Verfahren(CamelModel):
     """Payment procedure (Ein-/Auszahlungsverfahren)."""
 
     bezeichnung: str | None = None
-    bezeichnung_kurz: str | None = Field(None, alias="bezeichnungKurz")
+    bezeichnung_kurz: str | None = None
 
 
-class Bankverbindung(BaseModel):
+class Bankverbindung(CamelModel):
     """Bank details from ``/api/personen/{id}/bankverbindungen``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     bankname: str | None = None
     bic: str | None = None
     iban: str | None = None
     inhaber: str | None = None
     ort: str | None = None
     mandatsreferenz: str | None = None
-    mandat_erteilt: str | None = Field(None, alias="mandatErteilt")
+    mandat_erteilt: str | None = None
     lastschriftart: str | None = None
     kreditorennummer: str | None = None
     zusatzfeld: str | None = None
@@ -424,7 +461,7 @@ class Bankverbindung(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-class CreateBankverbindungEntry(BaseModel):
+class CreateBankverbindungEntry(CamelModel):
     """Request body for ``POST /api/personen/{id}/bankverbindungen``."""
 
     iban: str
@@ -434,14 +471,14 @@ class CreateBankverbindungEntry(BaseModel):
     inhaber: str = ""
     ort: str = ""
     mandatsreferenz: str = ""
-    mandat_erteilt: str = Field("", alias="mandatErteilt")
+    mandat_erteilt: str = ""
     kreditorennummer: str = ""
     zusatzfeld: str = ""
 
     model_config = {"populate_by_name": True}
 
 
-class Zahlungen(BaseModel):
+class Zahlungen(CamelModel):
     """Monthly payment breakdown within a Beitrag."""
 
     januar: float = 0.0
@@ -458,41 +495,92 @@ class Zahlungen(BaseModel):
     dezember: float = 0.0
 
 
-class Beitrag(BaseModel):
+class Beitrag(CamelModel):
     """Fee/contribution from ``/api/personen/{id}/beitraege``."""
 
     id: str
-    zweit_organisation: str | None = Field(None, alias="zweitOrganisation")
+    zweit_organisation: str | None = None
     bearbeiter: str | None = None
-    gueltig_ab: str | None = Field(None, alias="gueltigAb")
-    gueltig_bis: str | None = Field(None, alias="gueltigBis")
-    geaendert_am: str | None = Field(None, alias="geaendertAm")
+    gueltig_ab: str | None = None
+    gueltig_bis: str | None = None
+    geaendert_am: str | None = None
     jahresbeitrag: float | None = None
     beitragstyp: str | None = None
     beitragsart: str | None = None
     zahlungsweise: str | None = None
-    erste_faelligkeit: str | None = Field(None, alias="ersteFaelligkeit")
-    naechste_zahlung: str | None = Field(None, alias="naechsteZahlung")
-    letzte_rechnung: str | None = Field(None, alias="letzteRechnung")
+    erste_faelligkeit: str | None = None
+    naechste_zahlung: str | None = None
+    letzte_rechnung: str | None = None
     kostenstelle: str | None = None
-    erhaelt_zeitung: bool = Field(False, alias="erhaeltZeitung")
+    erhaelt_zeitung: bool = False
     zahlungen: Zahlungen | None = None
     outdated: bool = False
     inactive: bool = False
 
-    model_config = {"populate_by_name": True}
-
 
-class CreateBeitragEntry(BaseModel):
+class CreateBeitragEntry(CamelModel):
     """Request body for ``POST /api/personen/{id}/beitraege``."""
 
     zahlungen: Zahlungen = Field(default_factory=Zahlungen)
-    erhaelt_zeitung: bool = Field(False, alias="erhaeltZeitung")
-    erste_faelligkeit: str = Field(alias="ersteFaelligkeit")
-    gueltig_ab: str = Field(alias="gueltigAb")
+    erhaelt_zeitung: bool = False
+    erste_faelligkeit: str
+    gueltig_ab: str
     zahlungsweise: str
     beitragsart: str
     beitragstyp: str
     jahresbeitrag: float
 
     model_config = {"populate_by_name": True}
+
+
+class PersonBundle(CamelModel):
+    """All per-person sub-resources, as returned by ``get_all_subresources``."""
+
+    abteilungen: list[Abteilung] = Field(default_factory=list)
+    dienstgrade: list[Dienstgrad] = Field(default_factory=list)
+    gruppen: list[Gruppe] = Field(default_factory=list)
+    bankverbindungen: list[Bankverbindung] = Field(default_factory=list)
+    beitraege: list[Beitrag] = Field(default_factory=list)
+    erreichbarkeiten: list[Erreichbarkeit] = Field(default_factory=list)
+
+
+# -- trusted construction ---------------------------------------------------
+
+
+@functools.cache
+def _construct_plan(
+    cls: type[BaseModel],
+) -> tuple[tuple[str, str, type[BaseModel] | None, bool], ...]:
+    """Return ``(key, field_name, nested_model, is_list)`` for each field of *cls*."""
+    plan = []
+    for name, field in cls.model_fields.items():
+        ann = field.annotation
+        if get_origin(ann) in (Union, types.UnionType):
+            ann = next((a for a in get_args(ann) if a is not type(None)), ann)
+        is_list = get_origin(ann) is list
+        if is_list:
+            ann = get_args(ann)[0]
+        nested = ann if isinstance(ann, type) and issubclass(ann, BaseModel) else None
+        plan.append((field.alias or name, name, nested, is_list))
+    return tuple(plan)
+
+
+def _trusted_build(cls: type[M], data: dict[str, Any]) -> M:
+    """Build *cls* from a trusted API response without validating it.
+
+    Nested models are constructed recursively with ``model_construct``.
+    Only keys present in *data* end up in ``model_fields_set``, so the
+    result round-trips through ``exclude_unset`` like a validated model.
+    """
+    values: dict[str, Any] = {}
+    for key, name, nested, is_list in _construct_plan(cls):
+        if key not in data:
+            continue
+        value = data[key]
+        if nested is not None and value is not None:
+            if is_list:
+                value = [_trusted_build(nested, v) for v in value]
+            else:
+                value = _trusted_build(nested, value)
+        values[name] = value
+    return cls.model_construct(**values)
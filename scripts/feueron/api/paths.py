@@ -0,0 +1,16 @@
+"""Path templates for the per-person sub-resources under ``/api/personen/{id}``.
+
+Keyed by sub-resource name; fill in the person ID with ``str.format``.
+Keeping them in one table lets code that walks every sub-resource of a
+person iterate over the same paths the mixins use.
+"""
+
+PERSON_SUBPATHS: dict[str, str] = {
+    "abteilungen": "/personen/{}/abteilungen",
+    "bankverbindungen": "/personen/{}/bankverbindungen",
+    "beitraege": "/personen/{}/beitraege",
+    "dienstgrade": "/personen/{}/dienstgrade",
+    "erreichbarkeiten": "/personen/{}/erreichbarkeiten",
+    "gruppen": "/personen/{}/gruppen",
+    "lock": "/personen/{}/lock",
+}
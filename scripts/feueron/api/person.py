@@ -2,87 +2,158 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import Any, Iterator, Literal, overload
+
+from pydantic_core import from_json
 
 from scripts.feueron.api.models import (
     Erreichbarkeit,
     Person,
     PersonDetail,
+    _trusted_build,
 )
-
-if TYPE_CHECKING:
-    from scripts.feueron.api.client import FeuerONClient
+from scripts.feueron.api.paths import PERSON_SUBPATHS
+from scripts.feueron.api.protocol import ClientProtocol
 
 
-class PersonMixin:
+class PersonMixin(ClientProtocol):
     """API methods for the Person top-level tab."""
 
-    self: FeuerONClient
+    def _personen_params(
+        self,
+        search: str,
+        person_ids: list[int | str] | str | None,
+        organisation_id: int | None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``/api/personen``."""
+        org_id = organisation_id or self._organisation_id
+        params: dict[str, Any] = {"organisationId": org_id}
+        if person_ids is not None:
+            params["personIds"] = (
+                person_ids
+                if isinstance(person_ids, str)
+                else ",".join(map(str, person_ids))
+            )
+        else:
+            params["search"] = search
+        return params
 
     def get_personen(
         self,
         *,
         search: str = "",
-        person_ids: list[int | str] | None = None,
+        person_ids: list[int | str] | str | None = None,
         organisation_id: int | None = None,
     ) -> list[Person]:
         """Fetch persons via ``/api/personen``.
 
-        Either search by name or fetch specific persons by ID.
+        Either search by name or fetch specific persons by ID.  *person_ids*
+        may also be an already comma-joined string.
         """
-        org_id = organisation_id or self._organisation_id
-        params: dict[str, Any] = {"organisationId": org_id}
-        if person_ids is not None:
-            params["personIds"] = ",".join(str(pid) for pid in person_ids)
-        else:
-            params["search"] = search
+        params = self._personen_params(search, person_ids, organisation_id)
         return self._get_list("/personen", Person, params=params)
 
+    def iter_personen(
+        self,
+        *,
+        search: str = "",
+        person_ids: list[int | str] | str | None = None,
+        organisation_id: int | None = None,
+    ) -> Iterator[Person]:
+        """Like :meth:`get_personen`, but yield persons one at a time."""
+        params = self._personen_params(search, person_ids, organisation_id)
+        return self._iter_list("/personen", Person, params=params)
+
     def get_person(self, person_id: int | str) -> PersonDetail:
         """Fetch full person detail via ``GET /api/personen/{id}``."""
         return self._get_object(f"/personen/{person_id}", PersonDetail)
 
-    def update_person(self, person: PersonDetail) -> PersonDetail:
+    def update_person(
+        self, person: PersonDetail, *, strict: bool = False
+    ) -> PersonDetail:
         """Update a person via ``PATCH /api/personen/{id}`` (partial JSON merge).
 
-        Only fields that were explicitly set on the model are sent.
+        Only fields that were explicitly set on the model are sent.  The
+        response is trusted and built without validation unless *strict*
+        is set.
         """
-        resp = self._request(
+        resp = self._send_model(
             "PATCH",
             f"/personen/{person.id}",
-            json=person.model_dump(by_alias=True, exclude_unset=True),
+            person,
+            exclude_unset=True,
         )
-        return PersonDetail.model_validate(resp.json())
+        if strict:
+            return PersonDetail.model_validate_json(resp.content)
+        return _trusted_build(PersonDetail, from_json(resp.content))
 
     def is_locked(self, person_id: int | str) -> bool:
         """Check whether a person is currently locked for editing."""
         from scripts.feueron.api.client import FeuerONAPIError
 
-        try:
-            self._request("GET", f"/personen/{person_id}/lock")
-        except FeuerONAPIError as exc:
-            if exc.status_code == 404:
-                return False
-            raise
+        resp = self._request(
+            "HEAD", PERSON_SUBPATHS["lock"].format(person_id), raise_for_status=False
+        )
+        if resp.status_code == 404:
+            return False
+        if resp.status_code >= 400:
+            raise FeuerONAPIError(resp.status_code)
         return True
 
     def lock_person(self, person_id: int | str) -> None:
         """Acquire an edit lock on a person (PUT /personen/{id}/lock)."""
-        self._request("PUT", f"/personen/{person_id}/lock")
+        self._request("PUT", PERSON_SUBPATHS["lock"].format(person_id))
 
     def unlock_person(self, person_id: int | str) -> None:
         """Release the edit lock on a person (DELETE /personen/{id}/lock)."""
-        self._request("DELETE", f"/personen/{person_id}/lock")
+        self._request("DELETE", PERSON_SUBPATHS["lock"].format(person_id))
 
     def get_erreichbarkeiten(self, person_id: int | str) -> list[Erreichbarkeit]:
         """Return contact details for a person."""
-        return self._get_list(f"/personen/{person_id}/erreichbarkeiten", Erreichbarkeit)
+        return self._get_list(
+            PERSON_SUBPATHS["erreichbarkeiten"].format(person_id), Erreichbarkeit
+        )
+
+    def iter_erreichbarkeiten(self, person_id: int | str) -> Iterator[Erreichbarkeit]:
+        """Like :meth:`get_erreichbarkeiten`, but yield entries one at a time."""
+        return self._iter_list(
+            PERSON_SUBPATHS["erreichbarkeiten"].format(person_id), Erreichbarkeit
+        )
+
+    @overload
+    def delete_erreichbarkeiten(
+        self,
+        person_id: int | str,
+        erreichbarkeit_ids: list[int | str],
+        return_result: Literal[False] = ...,
+    ) -> None: ...
 
+    @overload
     def delete_erreichbarkeiten(
-        self, person_id: int | str, erreichbarkeit_ids: list[int | str]
-    ) -> list[Erreichbarkeit]:
+        self,
+        person_id: int | str,
+        erreichbarkeit_ids: list[int | str],
+        return_result: Literal[True],
+    ) -> list[Erreichbarkeit]: ...
+
+    @overload
+    def delete_erreichbarkeiten(
+        self,
+        person_id: int | str,
+        erreichbarkeit_ids: list[int | str],
+        return_result: bool,
+    ) -> list[Erreichbarkeit] | None: ...
+
+    def delete_erreichbarkeiten(
+        self,
+        person_id: int | str,
+        erreichbarkeit_ids: list[int | str],
+        return_result: bool = False,
+    ) -> list[Erreichbarkeit] | None:
         """Remove one or more Erreichbarkeiten entries."""
         ops = [{"op": "remove", "path": f"/{eid}"} for eid in erreichbarkeit_ids]
-        return self._patch(
-            f"/personen/{person_id}/erreichbarkeiten", ops, Erreichbarkeit
-        )
+        path = PERSON_SUBPATHS["erreichbarkeiten"].format(person_id)
+        if not return_result:
+            self._patch_noresult(path, ops)
+            return None
+        return self._patch(path, ops, Erreichbarkeit)
@@ -0,0 +1,47 @@
+"""Structural type for the request helpers the API mixins rely on."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterator, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    import httpx
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class ClientProtocol(Protocol):
+    """Request helpers provided by ``FeuerONClient``.
+
+    The tab mixins inherit from this protocol instead of importing
+    ``FeuerONClient`` for type checking, which keeps the mixin modules
+    free of an import cycle with ``client.py``.
+    """
+
+    _organisation_id: int | None
+
+    def _request(
+        self, method: str, path: str, *, raise_for_status: bool = True, **kwargs: Any
+    ) -> httpx.Response: ...
+
+    def _send_model(
+        self, method: str, path: str, body: BaseModel, **dump_kwargs: Any
+    ) -> httpx.Response: ...
+
+    def _get_json(self, path: str, params: dict[str, Any] | None = None) -> Any: ...
+
+    def _get_list(self, path: str, model: type[T], **kwargs: Any) -> list[T]: ...
+
+    def _iter_list(self, path: str, model: type[T], **kwargs: Any) -> Iterator[T]: ...
+
+    def _get_object(self, path: str, model: type[T], **kwargs: Any) -> T: ...
+
+    def _post_text(self, path: str, **kwargs: Any) -> str: ...
+
+    def _patch(
+        self, path: str, operations: list[dict[str, Any]], model: type[T]
+    ) -> list[T]: ...
+
+    def _patch_noresult(self, path: str, operations: list[dict[str, Any]]) -> None: ...
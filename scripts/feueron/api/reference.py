@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Any, Iterator
+
+from pydantic_core import from_json
 
 from scripts.feueron.api.models import (
     AbteilungValue,
@@ -11,25 +13,23 @@ from scripts.feueron.api.models import (
     GeneralMenu,
     OrganisationTree,
     PersonDetail,
+    _trusted_build,
 )
-
-if TYPE_CHECKING:
-    from scripts.feueron.api.client import FeuerONClient
+from scripts.feueron.api.protocol import ClientProtocol
 
 
-class ReferenceMixin:
+class ReferenceMixin(ClientProtocol):
     """API methods for reference data and person creation."""
 
-    self: FeuerONClient
-
     def get_general_menus(self, *names: str) -> list[GeneralMenu]:
         """Return named menus from ``/api/personen/general-menus``.
 
         Pass one or more menu names, e.g.
         ``get_general_menus("ZUG_GRUPPE", "ZUG_GRUPPE_FUNKTION")``.
         """
-        params = [("name", n) for n in names]
-        return self._get_list("/personen/general-menus", GeneralMenu, params=params)
+        return self._get_list(
+            "/personen/general-menus", GeneralMenu, params={"name": list(names)}
+        )
 
     def get_beitragsarten(self) -> list[str]:
         """Return available Beitragsarten from ``/api/beitragsarten``."""
@@ -51,19 +51,38 @@ class ReferenceMixin:
             params={"accessType": access_type},
         )
 
+    def _organisationen_tree_params(
+        self, from_organisation_id: int | str | None
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``/organisationen-tree``."""
+        return {
+            "fromOrganisationIdAndBelow": from_organisation_id or self._organisation_id,
+            "requiredRechteForSelectability": "DARF_FUER_ENTITAETEN_ERSTELLUNG_GENUTZT_WERDEN",
+        }
+
     def get_organisationen_tree(
         self,
         from_organisation_id: int | str | None = None,
     ) -> OrganisationTree:
         """Return the organisation tree for person creation."""
-        org_id = from_organisation_id or self._organisation_id
         return self._get_object(
             "/organisationen-tree",
             OrganisationTree,
-            params={
-                "fromOrganisationIdAndBelow": org_id,
-                "requiredRechteForSelectability": "DARF_FUER_ENTITAETEN_ERSTELLUNG_GENUTZT_WERDEN",
-            },
+            params=self._organisationen_tree_params(from_organisation_id),
+        )
+
+    def get_organisationen_tree_raw(
+        self,
+        from_organisation_id: int | str | None = None,
+    ) -> dict[str, Any]:
+        """Like :meth:`get_organisationen_tree`, but return the parsed JSON.
+
+        No models are built; pair with :func:`iter_selectable_nodes` when
+        only the selectable organisations are needed.
+        """
+        return self._get_json(
+            "/organisationen-tree",
+            params=self._organisationen_tree_params(from_organisation_id),
         )
 
     def generate_personalnummer(
@@ -94,11 +113,34 @@ class ReferenceMixin:
             },
         )
 
-    def create_person(self, person: CreatePersonRequest) -> PersonDetail:
-        """Create a new person via ``POST /api/personen``."""
-        resp = self._request(
+    def create_person(
+        self, person: CreatePersonRequest, *, strict: bool = False
+    ) -> PersonDetail:
+        """Create a new person via ``POST /api/personen``.
+
+        The response is trusted and built without validation unless
+        *strict* is set.
+        """
+        resp = self._send_model(
             "POST",
             "/personen",
-            json=person.model_dump(by_alias=True, exclude_none=True),
+            person,
+            exclude_none=True,
         )
-        return PersonDetail.model_validate(resp.json())
+        if strict:
+            return PersonDetail.model_validate_json(resp.content)
+        return _trusted_build(PersonDetail, from_json(resp.content))
+
+
+def iter_selectable_nodes(tree: dict[str, Any]) -> Iterator[tuple[str, str | None]]:
+    """Yield ``(organisationId, bezeichnung)`` for each selectable node.
+
+    Walks the raw JSON from ``get_organisationen_tree_raw`` with an
+    explicit stack, in depth-first order.
+    """
+    stack = list(reversed(tree.get("children", [])))
+    while stack:
+        node = stack.pop()
+        if node.get("selectable") and node.get("organisationId") is not None:
+            yield node["organisationId"], node.get("bezeichnung")
+        stack.extend(reversed(node.get("children", [])))
@@ -3,19 +3,97 @@
 Functions are called from the Typer CLI (``scripts/cli.py``).
 """
 
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
-
-from tools.annotation import annotate_screenshot
-from tools.browserframe import wrap_in_browser_frame
+from typing import Any, Callable
 
 from scripts.feueron.annotations import get_annotations
-from scripts.feueron.screenshots import take_screenshots
+from scripts.feueron.screenshots import iter_screenshots, take_screenshots
 
 # Output directories
 SCREENSHOTS_DIR = Path("docs/assets/feueron/screenshots/raw")
 ANNOTATED_DIR = Path("docs/assets/feueron/screenshots/annotated")
 FRAMED_DIR = Path("docs/assets/feueron/screenshots/framed")
 
+# Marker hash per annotated file (keyed by absolute path), so edited markers
+# trigger a rebuild.  Kept out of the docs tree, which the site is built from.
+MARKER_STAMPS = Path.home() / ".cache" / "feueron" / "screenshot-markers.json"
+
+# Browser frame styling shared by every framed screenshot.
+FRAME_OPTIONS: dict[str, Any] = {
+    "profile": "generic_light",
+    "padding": 40,
+    "shadow_amount": 20,
+}
+
+
+def _marker_stamp(markers: list[Any]) -> str:
+    """Return a short hash identifying a set of markers."""
+    return hashlib.blake2b(repr(markers).encode(), digest_size=8).hexdigest()
+
+
+def _load_stamps() -> dict[str, str]:
+    """Return the stored marker hash per annotated file."""
+    return json.loads(MARKER_STAMPS.read_text()) if MARKER_STAMPS.exists() else {}
+
+
+def _save_stamps(stamps: dict[str, str]) -> None:
+    MARKER_STAMPS.parent.mkdir(parents=True, exist_ok=True)
+    MARKER_STAMPS.write_text(json.dumps(stamps, indent=2))
+
+
+def _is_fresh(source_path: Path, output_path: Path) -> bool:
+    """Return True if *output_path* exists and is not older than *source_path*."""
+    return (
+        output_path.exists()
+        and output_path.stat().st_mtime >= source_path.stat().st_mtime
+    )
+
+
+def _list_pngs(directory: Path) -> list[Path]:
+    """Return the PNG files in *directory* (empty if it does not exist)."""
+    if not directory.exists():
+        return []
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith(".png") and entry.is_file()
+        ]
+
+
+def _run_in_processes(jobs: dict[Path, Callable[[], Any]], message: str) -> list[Path]:
+    """Run image jobs (output path -> picklable callable) on all cores.
+
+    PIL work is CPU-bound, so each image is processed in its own worker
+    process.  Progress is printed as jobs finish; the returned paths keep
+    the order of *jobs*.
+    """
+    if not jobs:
+        return []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {pool.submit(job): output_path for output_path, job in jobs.items()}
+        for future in as_completed(futures):
+            future.result()
+            print(f"{message}: {futures[future]}")
+    return list(jobs)
+
+
+def _annotate_then_frame(
+    source_path: Path, annotated_path: Path, markers: list[Any], framed_path: Path
+) -> None:
+    """Worker: draw *markers* on a screenshot, then frame the result."""
+    from tools.annotation import annotate_screenshot
+    from tools.browserframe import wrap_in_browser_frame
+
+    annotate_screenshot(source_path, annotated_path, markers)
+    wrap_in_browser_frame(annotated_path, framed_path, **FRAME_OPTIONS)
+
 
 def generate_screenshots() -> list[Path]:
     """Take all FeuerON screenshots."""
@@ -25,8 +103,14 @@ def generate_screenshots() -> list[Path]:
     return take_screenshots(SCREENSHOTS_DIR)
 
 
-def apply_annotations() -> list[Path]:
-    """Apply annotations to screenshots."""
+def apply_annotations(force: bool = False) -> list[Path]:
+    """Apply annotations to screenshots.
+
+    Outputs newer than their source and drawn with unchanged markers are
+    skipped unless *force* is set.
+    """
+    from tools.annotation import annotate_screenshot
+
     print("\n" + "=" * 60)
     print("Applying annotations...")
     print("=" * 60)
@@ -34,7 +118,10 @@ def apply_annotations() -> list[Path]:
     ANNOTATED_DIR.mkdir(parents=True, exist_ok=True)
 
     annotations = get_annotations()
-    output_paths: list[Path] = []
+    stamps = _load_stamps()
+    jobs: dict[Path, Callable[[], Any]] = {}
+    new_stamps: dict[str, str] = {}
+    skipped = 0
 
     for source_filename, annotation_list in annotations.items():
         source_path = SCREENSHOTS_DIR / source_filename
@@ -52,13 +139,30 @@ def apply_annotations() -> list[Path]:
 
             output_filename = source_path.stem + output_suffix + source_path.suffix
             output_path = ANNOTATED_DIR / output_filename
+            stamp = _marker_stamp(markers)
+            stamp_key = str(output_path.resolve())
+
+            if (
+                not force
+                and stamps.get(stamp_key) == stamp
+                and _is_fresh(source_path, output_path)
+            ):
+                skipped += 1
+                continue
 
-            annotate_screenshot(source_path, output_path, markers)
-            output_paths.append(output_path)
-            print(f"Created annotated image: {output_path}")
+            jobs[output_path] = partial(
+                annotate_screenshot, source_path, output_path, markers
+            )
+            new_stamps[stamp_key] = stamp
+
+    output_paths = _run_in_processes(jobs, "Created annotated image")
+    if new_stamps:
+        _save_stamps({**stamps, **new_stamps})
 
     if output_paths:
         print(f"\nAnnotations completed: {len(output_paths)} files created")
+    elif skipped:
+        print(f"\nAnnotations up to date: {skipped} files unchanged")
     else:
         print(
             "\nNo annotations defined. Edit scripts/feueron/annotations.py to add markers."
@@ -67,64 +171,128 @@ def apply_annotations() -> list[Path]:
     return output_paths
 
 
-def apply_frames() -> list[Path]:
+def apply_frames(force: bool = False) -> list[Path]:
     """Wrap screenshots in browser frames.
 
     Processes annotated screenshots if they exist, otherwise falls back to raw screenshots.
+    Frames newer than their source are skipped unless *force* is set.
     """
+    from tools.browserframe import wrap_in_browser_frame
+
     print("\n" + "=" * 60)
     print("Applying browser frames...")
     print("=" * 60)
 
     FRAMED_DIR.mkdir(parents=True, exist_ok=True)
 
-    output_paths: list[Path] = []
+    frame = partial(wrap_in_browser_frame, **FRAME_OPTIONS)
+    jobs: dict[Path, Callable[[], Any]] = {}
+    skipped = 0
 
-    # Get all annotated screenshots
-    annotated_files = (
-        list(ANNOTATED_DIR.glob("*.png")) if ANNOTATED_DIR.exists() else []
-    )
-
-    # Get all raw screenshots
-    raw_files = list(SCREENSHOTS_DIR.glob("*.png")) if SCREENSHOTS_DIR.exists() else []
+    annotated_files = _list_pngs(ANNOTATED_DIR)
+    raw_files = _list_pngs(SCREENSHOTS_DIR)
 
     # Process annotated screenshots
     for source_path in annotated_files:
         output_path = FRAMED_DIR / source_path.name
-
-        wrap_in_browser_frame(
-            source_path,
-            output_path,
-            profile="generic_light",
-            padding=40,
-            shadow_amount=20,
-        )
-        output_paths.append(output_path)
-        print(f"Created framed image: {output_path}")
+        if force or not _is_fresh(source_path, output_path):
+            jobs[output_path] = partial(frame, source_path, output_path)
+        else:
+            skipped += 1
+
+    # Annotated files are named <raw stem><output suffix>, where the suffix
+    # starts with "_".  Collect every raw stem they could derive from: the
+    # full stem plus each prefix that ends right before an underscore.
+    annotated_bases: set[str] = set()
+    for af in annotated_files:
+        annotated_bases.add(af.stem)
+        annotated_bases.update(af.stem[:i] for i, c in enumerate(af.stem) if c == "_")
 
     # Process raw screenshots that don't have annotated versions
     for source_path in raw_files:
-        # Check if this raw file has any annotated versions
-        has_annotated = any(
-            af.stem.startswith(source_path.stem) for af in annotated_files
-        )
-
-        if not has_annotated:
+        if source_path.stem not in annotated_bases:
             output_path = FRAMED_DIR / source_path.name
+            if force or not _is_fresh(source_path, output_path):
+                jobs[output_path] = partial(frame, source_path, output_path)
+            else:
+                skipped += 1
 
-            wrap_in_browser_frame(
-                source_path,
-                output_path,
-                profile="generic_light",
-                padding=40,
-                shadow_amount=20,
-            )
-            output_paths.append(output_path)
-            print(f"Created framed image: {output_path}")
+    output_paths = _run_in_processes(jobs, "Created framed image")
 
     if output_paths:
         print(f"\nFrames completed: {len(output_paths)} files created")
+    elif skipped:
+        print(f"\nFrames up to date: {skipped} files unchanged")
     else:
         print("\nNo screenshots found to frame.")
 
     return output_paths
+
+
+def run_pipeline() -> list[Path]:
+    """Capture, annotate and frame all screenshots with the stages overlapped.
+
+    Each screenshot is handed to a worker process as soon as Playwright has
+    saved it, so the PIL work runs while the browser navigates to the next
+    page.  Annotation and framing of one screenshot run back to back in the
+    same worker.  Returns the framed images.
+
+    The workers are started by a fork server rather than forked from this
+    process: the first submit happens inside the Playwright session, and
+    forked workers would inherit the driver's stdin pipe and keep Playwright
+    from shutting down.
+    """
+    from tools.browserframe import wrap_in_browser_frame
+
+    print("=" * 60)
+    print("Capturing, annotating and framing FeuerON screenshots...")
+    print("=" * 60)
+
+    ANNOTATED_DIR.mkdir(parents=True, exist_ok=True)
+    FRAMED_DIR.mkdir(parents=True, exist_ok=True)
+
+    annotations = get_annotations()
+    new_stamps: dict[str, str] = {}
+    futures: dict[Future[None], Path] = {}
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("forkserver")
+    ) as pool:
+        for source_path in iter_screenshots(SCREENSHOTS_DIR):
+            marker_sets = [
+                (suffix, markers)
+                for suffix, markers in annotations.get(source_path.name, [])
+                if markers
+            ]
+            if not marker_sets:
+                framed_path = FRAMED_DIR / source_path.name
+                future = pool.submit(
+                    wrap_in_browser_frame, source_path, framed_path, **FRAME_OPTIONS
+                )
+                futures[future] = framed_path
+                continue
+
+            for output_suffix, markers in marker_sets:
+                annotated_path = ANNOTATED_DIR / (
+                    source_path.stem + output_suffix + source_path.suffix
+                )
+                framed_path = FRAMED_DIR / annotated_path.name
+                future = pool.submit(
+                    _annotate_then_frame,
+                    source_path,
+                    annotated_path,
+                    markers,
+                    framed_path,
+                )
+                futures[future] = framed_path
+                new_stamps[str(annotated_path.resolve())] = _marker_stamp(markers)
+
+        for future in as_completed(futures):
+            future.result()
+            print(f"Created framed image: {futures[future]}")
+
+    if new_stamps:
+        _save_stamps({**_load_stamps(), **new_stamps})
+
+    print(f"\nPipeline completed: {len(futures)} framed images")
+    return list(futures.values())
@@ -13,11 +13,15 @@ import logging
 from pathlib import Path
 from typing import NamedTuple
 
-import openpyxl
 import typer
 
+from scripts.feueron.migration.fox112 import (
+    GESCHLECHT_MAP,
+    index_by_name,
+    read_fox112_excel,
+)
 from scripts.feueron.migration.report_parser import iter_report_rows
-from scripts.feueron.models import Geschlecht, PersonRecord, PvBank, PvDb, generate_csv
+from scripts.feueron.models import PersonRecord, PvBank, PvDb, generate_csv
 
 logger = logging.getLogger(__name__)
 
@@ -93,12 +97,8 @@ def parse_bankverbindungen(path: Path) -> list[BankverbindungEntry]:
                 mandatsreferenz = row3[2].strip() if len(row3) > 2 else ""
                 bic = row3[6].strip() if len(row3) > 6 else ""
 
-        # Split "Nachname, Vorname"
-        if ", " in name:
-            nachname, vorname = name.split(", ", 1)
-        else:
-            nachname = name
-            vorname = ""
+        # Split "Nachname, Vorname" (no comma: everything is the Nachname)
+        nachname, _, vorname = name.partition(", ")
 
         entries.append(
             BankverbindungEntry(
@@ -137,64 +137,15 @@ class _Fox112BankPerson(NamedTuple):
 
 def _read_fox112_excel(path: Path) -> list[_Fox112BankPerson]:
     """Read bank-relevant columns from a Fox112 Excel export."""
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
-
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    col = {name: idx for idx, name in enumerate(headers) if name}
-
-    required = {
-        "NACHNAME",
-        "VORNAME",
-        "GESCHLECHT",
-        "GEBURTSTAG",
-        "ABTEILUNG",
-        "KONTOINHABER",
-        "IBAN",
-        "BIC",
-        "MANDATSREFERENZ",
-    }
-    missing = required - col.keys()
-    if missing:
-        msg = f"Fox112 Excel is missing columns: {', '.join(sorted(missing))}"
-        raise ValueError(msg)
-
-    persons: list[_Fox112BankPerson] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        nachname = str(row[col["NACHNAME"]] or "").strip()
-        vorname = str(row[col["VORNAME"]] or "").strip()
-        if not nachname:
-            continue
-        abteilung = str(row[col["ABTEILUNG"]] or "").strip()
-        if abteilung == "Externe Kontakte":
-            continue
-        persons.append(
-            _Fox112BankPerson(
-                nachname=nachname,
-                vorname=vorname,
-                geschlecht=str(row[col["GESCHLECHT"]] or "").strip(),
-                geburtstag=str(row[col["GEBURTSTAG"]] or "").strip(),
-                kontoinhaber=str(row[col["KONTOINHABER"]] or "").strip(),
-                iban=str(row[col["IBAN"]] or "").strip(),
-                bic=str(row[col["BIC"]] or "").strip(),
-                mandatsreferenz=str(row[col["MANDATSREFERENZ"]] or "").strip(),
-            )
-        )
-
-    wb.close()
-    return persons
+    return read_fox112_excel(
+        path, _Fox112BankPerson, keep=lambda abteilung: abteilung != "Externe Kontakte"
+    )
 
 
 # ---------------------------------------------------------------------------
 # Core: build bank-update CSV
 # ---------------------------------------------------------------------------
 
-_GESCHLECHT_MAP = {
-    "M": Geschlecht.MAENNLICH,
-    "W": Geschlecht.WEIBLICH,
-    "J": Geschlecht.JURISTISCH,
-}
-
 
 def build_bank_update(
     fox112_excel: Path,
@@ -217,10 +168,7 @@ def build_bank_update(
     fox112_persons = _read_fox112_excel(fox112_excel)
 
     # 2. Build Fox112 name index
-    fox_by_name: dict[tuple[str, str], list[_Fox112BankPerson]] = {}
-    for person in fox112_persons:
-        key = (person.nachname.lower(), person.vorname.lower())
-        fox_by_name.setdefault(key, []).append(person)
+    fox_by_name = index_by_name(fox112_persons)
 
     # 3. Match and build PersonRecords
     records: list[PersonRecord] = []
@@ -256,7 +204,7 @@ def build_bank_update(
             continue
 
         fox = candidates[0]
-        geschlecht = _GESCHLECHT_MAP.get(fox.geschlecht.upper())
+        geschlecht = GESCHLECHT_MAP.get(fox.geschlecht.upper())
         if geschlecht is None:
             logger.warning(
                 "Unknown GESCHLECHT '%s' for %s, %s — skipped",
@@ -8,18 +8,25 @@ and current values for diff logging.
 
 from __future__ import annotations
 
+import functools
 import io
 import logging
 from pathlib import Path
 from typing import NamedTuple
 
-import openpyxl
 import phonenumbers
 import typer
 
-from scripts.feueron.migration.erreichbarkeiten_parser import parse_erreichbarkeiten
+from scripts.feueron.migration.erreichbarkeiten_parser import (
+    ErreichbarkeitenEntry,
+    parse_erreichbarkeiten,
+)
+from scripts.feueron.migration.fox112 import (
+    GESCHLECHT_MAP,
+    index_by_name,
+    read_fox112_excel,
+)
 from scripts.feueron.models import (
-    Geschlecht,
     PersonRecord,
     PvDb,
     PvTelep,
@@ -56,68 +63,11 @@ class _Fox112ContactPerson(NamedTuple):
 
 def _read_fox112_excel(path: Path) -> list[_Fox112ContactPerson]:
     """Read address and contact columns from a Fox112 Excel export."""
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
-
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    col = {name: idx for idx, name in enumerate(headers) if name}
-
-    required = {
-        "NACHNAME",
-        "VORNAME",
-        "GESCHLECHT",
-        "GEBURTSTAG",
-        "ABTEILUNG",
-        "STRASSE",
-        "HAUSNR",
-        "PLZ",
-        "ORT",
-        "TEL_P",
-        "TEL_D",
-        "MOBIL_P",
-        "MOBIL_D",
-        "EMAIL_P",
-        "EMAIL_D",
-        "FAX_P",
-        "FAX_D",
-    }
-    missing = required - col.keys()
-    if missing:
-        msg = f"Fox112 Excel is missing columns: {', '.join(sorted(missing))}"
-        raise ValueError(msg)
-
-    persons: list[_Fox112ContactPerson] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        nachname = str(row[col["NACHNAME"]] or "").strip()
-        vorname = str(row[col["VORNAME"]] or "").strip()
-        if not nachname:
-            continue
-        abteilung = str(row[col["ABTEILUNG"]] or "").strip()
-        if abteilung == "Externe Kontakte":
-            continue
-        persons.append(
-            _Fox112ContactPerson(
-                nachname=nachname,
-                vorname=vorname,
-                geschlecht=str(row[col["GESCHLECHT"]] or "").strip(),
-                geburtstag=str(row[col["GEBURTSTAG"]] or "").strip(),
-                strasse=str(row[col["STRASSE"]] or "").strip(),
-                hausnr=str(row[col["HAUSNR"]] or "").strip(),
-                plz=str(row[col["PLZ"]] or "").strip(),
-                ort=str(row[col["ORT"]] or "").strip(),
-                tel_p=str(row[col["TEL_P"]] or "").strip(),
-                tel_d=str(row[col["TEL_D"]] or "").strip(),
-                mobil_p=str(row[col["MOBIL_P"]] or "").strip(),
-                mobil_d=str(row[col["MOBIL_D"]] or "").strip(),
-                email_p=str(row[col["EMAIL_P"]] or "").strip(),
-                email_d=str(row[col["EMAIL_D"]] or "").strip(),
-                fax_p=str(row[col["FAX_P"]] or "").strip(),
-                fax_d=str(row[col["FAX_D"]] or "").strip(),
-            )
-        )
-
-    wb.close()
-    return persons
+    return read_fox112_excel(
+        path,
+        _Fox112ContactPerson,
+        keep=lambda abteilung: abteilung != "Externe Kontakte",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -125,10 +75,12 @@ def _read_fox112_excel(path: Path) -> list[_Fox112ContactPerson]:
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
 def _format_phone(raw: str) -> str:
     """Format a phone number to national German format using phonenumbers.
 
-    Returns the original string unchanged if parsing fails.
+    Returns the original string unchanged if parsing fails.  Results are
+    memoised: the same number recurs across persons and commands.
     """
     try:
         parsed = phonenumbers.parse(raw, "DE")
@@ -168,17 +120,31 @@ _CONTACT_FIELDS: list[tuple[str, TelArt, str, bool]] = [
     ("fax_d", TelArt.TELEFAX_DIENSTLICH, "telefax_dienstlich", True),
 ]
 
+# The same mappings with field names resolved to tuple positions once, so the
+# per-person diff indexes the NamedTuples instead of calling getattr().
+_ADDRESS_INDICES: list[tuple[int, str, int]] = [
+    (
+        _Fox112ContactPerson._fields.index(fox_field),
+        label,
+        ErreichbarkeitenEntry._fields.index(feueron_field),
+    )
+    for fox_field, label, feueron_field in _ADDRESS_FIELDS
+]
+_CONTACT_INDICES: list[tuple[int, TelArt, int, bool]] = [
+    (
+        _Fox112ContactPerson._fields.index(fox_field),
+        tel_art,
+        ErreichbarkeitenEntry._fields.index(feueron_field),
+        is_phone,
+    )
+    for fox_field, tel_art, feueron_field, is_phone in _CONTACT_FIELDS
+]
+
 
 # ---------------------------------------------------------------------------
 # Core: build contact-update CSV
 # ---------------------------------------------------------------------------
 
-_GESCHLECHT_MAP = {
-    "M": Geschlecht.MAENNLICH,
-    "W": Geschlecht.WEIBLICH,
-    "J": Geschlecht.JURISTISCH,
-}
-
 
 def build_contact_update(
     fox112_excel: Path,
@@ -199,10 +165,7 @@ def build_contact_update(
     fox112_persons = _read_fox112_excel(fox112_excel)
 
     # 2. Build Fox112 name index
-    fox_by_name: dict[tuple[str, str], list[_Fox112ContactPerson]] = {}
-    for person in fox112_persons:
-        key = (person.nachname.lower(), person.vorname.lower())
-        fox_by_name.setdefault(key, []).append(person)
+    fox_by_name = index_by_name(fox112_persons)
 
     # 3. Match and build PersonRecords
     records: list[PersonRecord] = []
@@ -238,7 +201,7 @@ def build_contact_update(
             continue
 
         fox = candidates[0]
-        geschlecht = _GESCHLECHT_MAP.get(fox.geschlecht.upper())
+        geschlecht = GESCHLECHT_MAP.get(fox.geschlecht.upper())
         if geschlecht is None:
             logger.warning(
                 "Unknown GESCHLECHT '%s' for %s, %s — skipped",
@@ -254,28 +217,22 @@ def build_contact_update(
             stammdaten_changes.append(
                 ("Geburtsdatum", entry.geburtsdatum, fox.geburtstag)
             )
-        for fox_field, label, feueron_field in _ADDRESS_FIELDS:
-            fox_val = getattr(fox, fox_field)
-            feueron_val = getattr(entry, feueron_field)
+        for fox_idx, label, feueron_idx in _ADDRESS_INDICES:
+            fox_val = fox[fox_idx]
+            feueron_val = entry[feueron_idx]
             if fox_val != feueron_val:
                 stammdaten_changes.append((label, feueron_val, fox_val))
 
-        # Build contact entries (with phone formatting)
-        erreichbarkeiten: list[PvTelep] = []
-        for fox_field, tel_art, _, is_phone in _CONTACT_FIELDS:
-            value = getattr(fox, fox_field)
-            if value:
-                formatted = _format_phone(value) if is_phone else value
-                erreichbarkeiten.append(PvTelep(TEL_ART=tel_art, TELEPHON=formatted))
-
-        # Detect contact changes (comparing formatted Fox112 values to FeuerON)
+        # Format each Fox112 contact once and compare it to FeuerON
+        contacts: list[tuple[TelArt, str]] = []
         contact_changes: list[tuple[str, str, str]] = []
-        for fox_field, tel_art, feueron_field, is_phone in _CONTACT_FIELDS:
-            fox_val = getattr(fox, fox_field)
+        for fox_idx, tel_art, feueron_idx, is_phone in _CONTACT_INDICES:
+            fox_val = fox[fox_idx]
             if not fox_val:
                 continue
             formatted = _format_phone(fox_val) if is_phone else fox_val
-            feueron_val = getattr(entry, feueron_field)
+            contacts.append((tel_art, formatted))
+            feueron_val = entry[feueron_idx]
             if formatted != feueron_val:
                 contact_changes.append((tel_art.value, feueron_val, formatted))
 
@@ -321,7 +278,10 @@ def build_contact_update(
                     ORT=fox.ort or None,
                     ORTSTEIL=entry.ortsteil or None,
                 ),
-                erreichbarkeiten=erreichbarkeiten,
+                erreichbarkeiten=[
+                    PvTelep(TEL_ART=tel_art, TELEPHON=value)
+                    for tel_art, value in contacts
+                ],
             )
         )
         matched += 1
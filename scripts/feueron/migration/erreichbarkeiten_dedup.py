@@ -8,13 +8,16 @@ keeping the sanitised value where applicable.
 
 from __future__ import annotations
 
+import functools
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httpx
 import phonenumbers
 import typer
 
-from scripts.feueron.api import FeuerONClient
+from scripts.feueron.api import FeuerONAPIError, FeuerONAuthError, FeuerONClient
 from scripts.feueron.api.models import Erreichbarkeit
 
 logger = logging.getLogger(__name__)
@@ -30,83 +33,92 @@ _PHONE_ARTS = {
 }
 
 
-def _normalise_phone(raw: str) -> str:
-    """Parse a phone string to E.164 for comparison purposes."""
-    try:
-        parsed = phonenumbers.parse(raw, "DE")
-        return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-    except phonenumbers.NumberParseException:
-        return raw
-
+@functools.cache
+def _phone_forms(raw: str) -> tuple[str, str | None]:
+    """Parse a phone string once; return its E.164 and German national forms.
 
-def _is_national_format(raw: str) -> bool:
-    """Return True if *raw* is already in German national format."""
+    E.164 is used for comparison, the national form to tell whether *raw* is
+    already sanitised.  Unparseable input yields ``(raw, None)``.
+    """
     try:
         parsed = phonenumbers.parse(raw, "DE")
-        national = phonenumbers.format_number(
-            parsed, phonenumbers.PhoneNumberFormat.NATIONAL
-        )
-        return raw == national
     except phonenumbers.NumberParseException:
-        return False
+        return raw, None
+    return (
+        phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164),
+        phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.NATIONAL),
+    )
 
 
 def _pick_removal(art: str, entries: list[Erreichbarkeit]) -> list[Erreichbarkeit]:
     """Decide which entries to remove from a group of same-art duplicates.
 
+    Entries are bucketed by value (E.164 for phone numbers, case-insensitive
+    otherwise) and each bucket keeps one entry: a phone number already in
+    national format wins, then the lowest ID (the original, not the import).
     Returns a list of entries to remove (may be empty).
     """
+    is_phone = art in _PHONE_ARTS
+    buckets: dict[str, list[Erreichbarkeit]] = defaultdict(list)
+    rank: dict[str, tuple[bool, int]] = {}
+    for entry in entries:
+        value = entry.kontaktdaten
+        if is_phone:
+            key, national = _phone_forms(value)
+            rank[entry.id] = (value != national, int(entry.id))
+        else:
+            key = value.lower()
+            rank[entry.id] = (False, int(entry.id))
+        buckets[key].append(entry)
+
     to_remove: list[Erreichbarkeit] = []
+    keepers: list[Erreichbarkeit] = []
+    for bucket in buckets.values():
+        keeper = min(bucket, key=lambda e: rank[e.id])
+        keepers.append(keeper)
+        to_remove.extend(e for e in bucket if e is not keeper)
+
+    if len(keepers) > 1:
+        logger.warning(
+            "  %s: values differ (%s) — skipped",
+            art,
+            " vs ".join(e.kontaktdaten for e in keepers),
+        )
 
-    # Compare all pairs; for N>2 duplicates, iteratively remove obvious dupes.
-    kept: list[Erreichbarkeit] = list(entries)
+    return to_remove
 
-    for i in range(len(kept)):
-        for j in range(i + 1, len(kept)):
-            a, b = kept[i], kept[j]
-            if a in to_remove or b in to_remove:
-                continue
 
-            val_a = a.kontaktdaten
-            val_b = b.kontaktdaten
-
-            if art in _PHONE_ARTS:
-                norm_a = _normalise_phone(val_a)
-                norm_b = _normalise_phone(val_b)
-                if norm_a == norm_b:
-                    # Same number — keep the one in national format,
-                    # or the lower ID (original) if both are equal.
-                    a_ok = _is_national_format(val_a)
-                    b_ok = _is_national_format(val_b)
-                    if a_ok and not b_ok:
-                        to_remove.append(b)
-                    elif b_ok and not a_ok:
-                        to_remove.append(a)
-                    else:
-                        # Both formatted the same — remove higher ID (import).
-                        victim = b if int(b.id) > int(a.id) else a
-                        to_remove.append(victim)
-                else:
-                    logger.warning(
-                        "  %s: values differ (%s vs %s) — skipped",
-                        art,
-                        val_a,
-                        val_b,
-                    )
-            else:
-                # Email or other: case-insensitive comparison
-                if val_a.lower() == val_b.lower():
-                    victim = b if int(b.id) > int(a.id) else a
-                    to_remove.append(victim)
-                else:
-                    logger.warning(
-                        "  %s: values differ (%s vs %s) — skipped",
-                        art,
-                        val_a,
-                        val_b,
-                    )
-
-    return to_remove
+def _remove_entries(
+    client: FeuerONClient, name: str, pid: str, removals: list[Erreichbarkeit]
+) -> int:
+    """Delete *removals* from one person and verify; return the number removed."""
+    removed_ids = {e.id for e in removals}
+    client.lock_person(pid)
+    try:
+        result = client.delete_erreichbarkeiten(
+            pid, list(removed_ids), return_result=True
+        )
+    finally:
+        client.unlock_person(pid)
+
+    # Verify the removed entries are actually gone
+    remaining_ids = {e.id for e in result}
+    still_present = removed_ids & remaining_ids
+    if still_present:
+        logger.error(
+            "%s (id=%s): FAILED: entries %s still present after PATCH",
+            name,
+            pid,
+            still_present,
+        )
+        for e in result:
+            logger.error("  RESPONSE: %s: %s (id=%s)", e.art, e.kontaktdaten, e.id)
+        return 0
+    for e in removals:
+        logger.info(
+            "%s (id=%s): DELETED %s: %s (id=%s)", name, pid, e.art, e.kontaktdaten, e.id
+        )
+    return len(removals)
 
 
 def dedup_erreichbarkeiten(
@@ -114,19 +126,34 @@ def dedup_erreichbarkeiten(
     *,
     dry_run: bool = False,
     yes: bool = False,
+    max_workers: int = 8,
 ) -> None:
-    """Find and remove duplicate Erreichbarkeiten for all persons."""
+    """Find and remove duplicate Erreichbarkeiten for all persons.
+
+    All entries are fetched, and the approved removals carried out, with at
+    most *max_workers* requests in flight; proposals are still reviewed and
+    confirmed person by person in between.  A person whose removal fails is
+    logged and counted, and the remaining approved persons are still
+    processed.
+    """
     persons = client.get_personen()
     logger.info("Found %d persons", len(persons))
 
+    # Fetch every person's entries up front, concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        all_entries = list(
+            pool.map(client.get_erreichbarkeiten, [p.id for p in persons])
+        )
+
     total_removed = 0
     total_skipped = 0
+    total_failed = 0
+    approved: list[tuple[str, str, list[Erreichbarkeit]]] = []
 
-    for person in persons:
+    for person, entries in zip(persons, all_entries):
         pid = person.id
         name = f"{person.vorname} {person.nachname}"
 
-        entries = client.get_erreichbarkeiten(pid)
         if not entries:
             continue
 
@@ -175,29 +202,38 @@ def dedup_erreichbarkeiten(
             total_skipped += len(removals)
             continue
 
-        # Execute removal (lock → delete → unlock)
-        removed_ids = {e.id for e in removals}
-        client.lock_person(pid)
-        try:
-            result = client.delete_erreichbarkeiten(pid, list(removed_ids))
-        finally:
-            client.unlock_person(pid)
-
-        # Verify the removed entries are actually gone
-        remaining_ids = {e.id for e in result}
-        still_present = removed_ids & remaining_ids
-        if still_present:
-            logger.error(
-                "  FAILED: entries %s still present after PATCH", still_present
-            )
-            for e in result:
-                logger.error("  RESPONSE: %s: %s (id=%s)", e.art, e.kontaktdaten, e.id)
-        else:
-            for e in removals:
-                logger.info("  DELETED %s: %s (id=%s)", e.art, e.kontaktdaten, e.id)
-            total_removed += len(removals)
+        approved.append((name, pid, removals))
+
+    # Execute removals (lock → delete → unlock per person) concurrently
+    if approved:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_remove_entries, client, name, pid, removals): (
+                    name,
+                    pid,
+                    removals,
+                )
+                for name, pid, removals in approved
+            }
+            for future in as_completed(futures):
+                name, pid, removals = futures[future]
+                try:
+                    removed = future.result()
+                except (FeuerONAPIError, FeuerONAuthError, httpx.HTTPError) as exc:
+                    logger.error("%s (id=%s): FAILED: %s", name, pid, exc)
+                    removed = 0
+                if removed:
+                    total_removed += removed
+                else:
+                    # Exception above, or entries still present after the PATCH
+                    total_failed += len(removals)
 
     if dry_run:
         logger.info("Dry run: %d entries would be removed", total_removed)
     else:
-        logger.info("Done: %d removed, %d skipped", total_removed, total_skipped)
+        logger.info(
+            "Done: %d removed, %d skipped, %d failed",
+            total_removed,
+            total_skipped,
+            total_failed,
+        )
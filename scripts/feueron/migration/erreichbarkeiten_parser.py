@@ -7,10 +7,11 @@ person from row 12 onward.
 
 from __future__ import annotations
 
+from operator import itemgetter
 from pathlib import Path
 from typing import NamedTuple
 
-import openpyxl
+from scripts.feueron.migration.excel import read_first_sheet
 
 
 class ErreichbarkeitenEntry(NamedTuple):
@@ -55,6 +56,7 @@ _COLUMNS = {
     "E-Mail privat": "email_privat",
     "E-Mail dienstlich": "email_dienstlich",
 }
+_REQUIRED_FIELDS = frozenset(_COLUMNS.values())
 
 
 def parse_erreichbarkeiten(path: Path) -> list[ErreichbarkeitenEntry]:
@@ -62,50 +64,28 @@ def parse_erreichbarkeiten(path: Path) -> list[ErreichbarkeitenEntry]:
 
     Expects the header row at row 11 (1-indexed) and data from row 12 onward.
     """
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
+    rows = read_first_sheet(path)
 
     # Read header at row 11
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=11, max_row=11))]
-    col: dict[str, int] = {}
-    for idx, h in enumerate(headers):
-        if h and h in _COLUMNS:
-            col[_COLUMNS[h]] = idx
+    headers = rows[10]
+    col = {_COLUMNS[h]: idx for idx, h in enumerate(headers) if h in _COLUMNS}
 
-    missing = set(_COLUMNS.values()) - col.keys()
+    missing = _REQUIRED_FIELDS - col.keys()
     if missing:
-        wb.close()
         msg = (
             f"Erreichbarkeiten report is missing columns: {', '.join(sorted(missing))}"
         )
         raise ValueError(msg)
 
+    # Resolve the columns once, in field order; each row is then a single
+    # itemgetter call instead of a dict lookup per field.
+    get_fields = itemgetter(*(col[f] for f in ErreichbarkeitenEntry._fields))
+
     entries: list[ErreichbarkeitenEntry] = []
-    for row in ws.iter_rows(min_row=12, values_only=True):
-        nachname = str(row[col["nachname"]] or "").strip()
-        if not nachname:
+    for row in rows[11:]:
+        values = [str(v or "").strip() for v in get_fields(row)]
+        if not values[0]:
             continue
-        entries.append(
-            ErreichbarkeitenEntry(
-                nachname=nachname,
-                vorname=str(row[col["vorname"]] or "").strip(),
-                personal_nr=str(row[col["personal_nr"]] or "").strip(),
-                geburtsdatum=str(row[col["geburtsdatum"]] or "").strip(),
-                strasse=str(row[col["strasse"]] or "").strip(),
-                hausnr=str(row[col["hausnr"]] or "").strip(),
-                plz=str(row[col["plz"]] or "").strip(),
-                ort=str(row[col["ort"]] or "").strip(),
-                ortsteil=str(row[col["ortsteil"]] or "").strip(),
-                telefon_privat=str(row[col["telefon_privat"]] or "").strip(),
-                telefon_dienstlich=str(row[col["telefon_dienstlich"]] or "").strip(),
-                telefax_privat=str(row[col["telefax_privat"]] or "").strip(),
-                telefax_dienstlich=str(row[col["telefax_dienstlich"]] or "").strip(),
-                mobil_privat=str(row[col["mobil_privat"]] or "").strip(),
-                mobil_dienstlich=str(row[col["mobil_dienstlich"]] or "").strip(),
-                email_privat=str(row[col["email_privat"]] or "").strip(),
-                email_dienstlich=str(row[col["email_dienstlich"]] or "").strip(),
-            )
-        )
+        entries.append(ErreichbarkeitenEntry._make(values))
 
-    wb.close()
     return entries
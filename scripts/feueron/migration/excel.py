@@ -0,0 +1,32 @@
+"""Shared helpers for reading Excel exports (Fox112, FeuerON reports)."""
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import Any
+
+from python_calamine import CalamineWorkbook
+
+
+def _cell(value: Any) -> Any:
+    # calamine returns every number as float and date-only cells as ``date``;
+    # map them back to what the readers have always seen (int / datetime).
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is datetime.date:
+        return datetime.datetime(value.year, value.month, value.day)
+    return value
+
+
+def read_first_sheet(path: Path) -> list[list[Any]]:
+    """Read every row of the first sheet of *path* into memory.
+
+    Parsed by calamine (Rust), which ignores the stored dimension record, so
+    exports with a bogus ``A1:A1`` dimension read correctly.  Row and column
+    positions start at ``A1`` (leading empty rows are kept) and every row has
+    the full sheet width.  The file is closed before the rows are returned.
+    """
+    with CalamineWorkbook.from_path(path) as wb:
+        rows = wb.get_sheet_by_index(0).to_python(skip_empty_area=False)
+    return [[_cell(value) for value in row] for row in rows]
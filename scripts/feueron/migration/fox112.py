@@ -0,0 +1,73 @@
+"""Shared Fox112 master-data helpers for the migration commands.
+
+The Fox112 Excel export has one row per person with upper-case column
+names (``NACHNAME``, ``VORNAME``, ``IBAN``, ...).  Each migration command
+declares a NamedTuple whose field names are the lower-case column names
+it needs and reads the export through :func:`read_fox112_excel`.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from operator import itemgetter
+from pathlib import Path
+from typing import TypeVar
+
+from scripts.feueron.migration.excel import read_first_sheet
+from scripts.feueron.models import Geschlecht
+
+P = TypeVar("P", bound=tuple)
+
+GESCHLECHT_MAP = {
+    "M": Geschlecht.MAENNLICH,
+    "W": Geschlecht.WEIBLICH,
+    "J": Geschlecht.JURISTISCH,
+}
+
+
+def read_fox112_excel(
+    path: Path, person_cls: type[P], *, keep: Callable[[str], bool]
+) -> list[P]:
+    """Read one *person_cls* per row of a Fox112 Excel export.
+
+    Every field of the NamedTuple *person_cls* is filled from the column of
+    the same name in upper case, as a stripped string; the first field must
+    be ``nachname``.  Rows without a Nachname are skipped, as are rows whose
+    ``ABTEILUNG`` is rejected by *keep*.
+    """
+    rows = read_first_sheet(path)
+
+    headers = rows[0]
+    col = {name: idx for idx, name in enumerate(headers) if name}
+
+    fields = person_cls._fields
+    missing = ({f.upper() for f in fields} | {"ABTEILUNG"}) - col.keys()
+    if missing:
+        msg = f"Fox112 Excel is missing columns: {', '.join(sorted(missing))}"
+        raise ValueError(msg)
+
+    # Resolve every column once; each row is then a single C-level itemgetter
+    # call instead of a dict lookup per field.
+    get_fields = itemgetter(*(col[f.upper()] for f in fields))
+    i_abteilung = col["ABTEILUNG"]
+
+    persons: list[P] = []
+    for row in rows[1:]:
+        # Filter on the Abteilung first so rejected rows skip the conversion
+        if not keep(str(row[i_abteilung] or "").strip()):
+            continue
+        values = [str(v or "").strip() for v in get_fields(row)]
+        if not values[0]:
+            continue
+        persons.append(person_cls._make(values))
+
+    return persons
+
+
+def index_by_name(persons: Iterable[P]) -> dict[tuple[str, str], list[P]]:
+    """Group Fox112 persons by lower-cased ``(nachname, vorname)``."""
+    by_name: dict[tuple[str, str], list[P]] = defaultdict(list)
+    for person in persons:
+        by_name[(person.nachname.lower(), person.vorname.lower())].append(person)
+    return by_name
@@ -10,19 +10,17 @@ export) are skipped — they were formerly active and must be added manually.
 from __future__ import annotations
 
 import logging
-import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import NamedTuple
 
-import openpyxl
 import typer
 
-from scripts.feueron.migration.contact_check import _format_phone
+from scripts.feueron.migration.contact_check import _CONTACT_FIELDS, _format_phone
 from scripts.feueron.migration.erreichbarkeiten_parser import parse_erreichbarkeiten
+from scripts.feueron.migration.fox112 import GESCHLECHT_MAP, read_fox112_excel
 from scripts.feueron.models import (
     BeitragArt,
-    Geschlecht,
     PersonRecord,
     PvAbt,
     PvBank,
@@ -70,121 +68,64 @@ class _Fox112PassivePerson(NamedTuple):
 
 def _read_fox112_excel(path: Path) -> list[_Fox112PassivePerson]:
     """Read passive members from a Fox112 Excel export."""
-    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    ws = wb.active
-
-    headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-    col = {name: idx for idx, name in enumerate(headers) if name}
-
-    required = {
-        "NACHNAME",
-        "VORNAME",
-        "GESCHLECHT",
-        "GEBURTSTAG",
-        "ABTEILUNG",
-        "EINTRITT",
-        "PERSONAL_NR",
-        "STRASSE",
-        "HAUSNR",
-        "PLZ",
-        "ORT",
-        "TEL_P",
-        "TEL_D",
-        "MOBIL_P",
-        "MOBIL_D",
-        "EMAIL_P",
-        "EMAIL_D",
-        "FAX_P",
-        "FAX_D",
-        "MITGLIEDSBEITRAG",
-        "ZAHLART",
-        "KONTOINHABER",
-        "IBAN",
-        "BIC",
-        "MANDATSREFERENZ",
-    }
-    missing = required - col.keys()
-    if missing:
-        msg = f"Fox112 Excel is missing columns: {', '.join(sorted(missing))}"
-        raise ValueError(msg)
-
-    persons: list[_Fox112PassivePerson] = []
-    for row in ws.iter_rows(min_row=2, values_only=True):
-        nachname = str(row[col["NACHNAME"]] or "").strip()
-        if not nachname:
-            continue
-        abteilung = str(row[col["ABTEILUNG"]] or "").strip()
-        if abteilung != "Fördernde Mitglieder":
-            continue
-        persons.append(
-            _Fox112PassivePerson(
-                nachname=nachname,
-                vorname=str(row[col["VORNAME"]] or "").strip(),
-                geschlecht=str(row[col["GESCHLECHT"]] or "").strip(),
-                geburtstag=str(row[col["GEBURTSTAG"]] or "").strip(),
-                eintritt=str(row[col["EINTRITT"]] or "").strip(),
-                personal_nr=str(row[col["PERSONAL_NR"]] or "").strip(),
-                strasse=str(row[col["STRASSE"]] or "").strip(),
-                hausnr=str(row[col["HAUSNR"]] or "").strip(),
-                plz=str(row[col["PLZ"]] or "").strip(),
-                ort=str(row[col["ORT"]] or "").strip(),
-                tel_p=str(row[col["TEL_P"]] or "").strip(),
-                tel_d=str(row[col["TEL_D"]] or "").strip(),
-                mobil_p=str(row[col["MOBIL_P"]] or "").strip(),
-                mobil_d=str(row[col["MOBIL_D"]] or "").strip(),
-                email_p=str(row[col["EMAIL_P"]] or "").strip(),
-                email_d=str(row[col["EMAIL_D"]] or "").strip(),
-                fax_p=str(row[col["FAX_P"]] or "").strip(),
-                fax_d=str(row[col["FAX_D"]] or "").strip(),
-                mitgliedsbeitrag=str(row[col["MITGLIEDSBEITRAG"]] or "").strip(),
-                zahlart=str(row[col["ZAHLART"]] or "").strip(),
-                kontoinhaber=str(row[col["KONTOINHABER"]] or "").strip(),
-                iban=str(row[col["IBAN"]] or "").strip(),
-                bic=str(row[col["BIC"]] or "").strip(),
-                mandatsreferenz=str(row[col["MANDATSREFERENZ"]] or "").strip(),
-            )
-        )
-
-    wb.close()
-    return persons
+    return read_fox112_excel(
+        path,
+        _Fox112PassivePerson,
+        keep=lambda abteilung: abteilung == "Fördernde Mitglieder",
+    )
 
 
 # ---------------------------------------------------------------------------
 # Fox112 XML history reader
 # ---------------------------------------------------------------------------
 
-_NAME_PREFIX_RE = re.compile(r"^#\d*\s*")
 
+def _strip_name_prefix(name: str) -> str:
+    """Strip the ``#`` / ``#N`` marker Fox112 puts in front of some last names."""
+    if not name.startswith("#"):
+        return name
+    i, n = 1, len(name)
+    while i < n and name[i].isdecimal():
+        i += 1
+    while i < n and name[i].isspace():
+        i += 1
+    return name[i:]
 
-def _read_xml_history(path: Path) -> set[tuple[str, str]]:
+
+def _read_xml_history(path: Path) -> frozenset[tuple[str, str]]:
     """Read the Fox112 XML and return names of persons with Dienstgrade or Funktionen.
 
     Names are lowercased for matching.  The ``#`` / ``#N`` prefix in XML
-    last names is stripped.
+    last names is stripped.  The file is streamed: each ``<Person>`` is
+    detached from its parent once processed, so only one person subtree is
+    held at a time.
     """
-    tree = ET.parse(path)  # noqa: S314
-    root = tree.getroot()
-
     has_history: set[tuple[str, str]] = set()
-    for person in root.iter("Person"):
-        dienstgrade = person.find("Dienstgrade")
-        funktionen = person.find("Funktionen")
-        dg_entries = dienstgrade.findall("Eintrag") if dienstgrade is not None else []
-        fn_entries = funktionen.findall("Eintrag") if funktionen is not None else []
-
-        if not dg_entries and not fn_entries:
+    open_elements: list[ET.Element] = []  # ancestors of the current element
+    for event, elem in ET.iterparse(path, events=("start", "end")):  # noqa: S314
+        if event == "start":
+            open_elements.append(elem)
             continue
-
-        nachname_el = person.find("Nachname")
-        vorname_el = person.find("Vorname")
-        if nachname_el is None or vorname_el is None:
+        open_elements.pop()
+        if elem.tag != "Person":
             continue
+        if _has_entries(elem, "Dienstgrade") or _has_entries(elem, "Funktionen"):
+            nachname_el = elem.find("Nachname")
+            vorname_el = elem.find("Vorname")
+            if nachname_el is not None and vorname_el is not None:
+                nachname = _strip_name_prefix((nachname_el.text or "").strip())
+                vorname = (vorname_el.text or "").strip()
+                has_history.add((nachname.lower(), vorname.lower()))
+        if open_elements:
+            open_elements[-1].remove(elem)
 
-        nachname = _NAME_PREFIX_RE.sub("", (nachname_el.text or "").strip()).lower()
-        vorname = (vorname_el.text or "").strip().lower()
-        has_history.add((nachname, vorname))
+    return frozenset(has_history)
 
-    return has_history
+
+def _has_entries(person: ET.Element, tag: str) -> bool:
+    """Return whether the *tag* child of *person* has at least one ``<Eintrag>``."""
+    section = person.find(tag)
+    return section is not None and section.find("Eintrag") is not None
 
 
 # ---------------------------------------------------------------------------
@@ -207,18 +148,13 @@ def _parse_beitrag(raw: str) -> float:
 
 
 # ---------------------------------------------------------------------------
-# Contact field mapping (same as contact_check.py)
+# Contact field mapping (shared with contact_check.py)
 # ---------------------------------------------------------------------------
 
-_CONTACT_FIELDS: list[tuple[str, TelArt, bool]] = [
-    ("tel_p", TelArt.TELEFON_PRIVAT, True),
-    ("tel_d", TelArt.TELEFON_DIENSTLICH, True),
-    ("mobil_p", TelArt.MOBIL_PRIVAT, True),
-    ("mobil_d", TelArt.MOBIL_DIENSTLICH, True),
-    ("email_p", TelArt.EMAIL_PRIVAT, False),
-    ("email_d", TelArt.EMAIL_DIENSTLICH, False),
-    ("fax_p", TelArt.TELEFAX_PRIVAT, True),
-    ("fax_d", TelArt.TELEFAX_DIENSTLICH, True),
+# (position in _Fox112PassivePerson, TelArt, is_phone)
+_CONTACT_INDICES: list[tuple[int, TelArt, bool]] = [
+    (_Fox112PassivePerson._fields.index(fox_field), tel_art, is_phone)
+    for fox_field, tel_art, _, is_phone in _CONTACT_FIELDS
 ]
 
 
@@ -226,12 +162,6 @@ _CONTACT_FIELDS: list[tuple[str, TelArt, bool]] = [
 # Core: build passive-import CSV
 # ---------------------------------------------------------------------------
 
-_GESCHLECHT_MAP = {
-    "M": Geschlecht.MAENNLICH,
-    "W": Geschlecht.WEIBLICH,
-    "J": Geschlecht.JURISTISCH,
-}
-
 
 def build_passive_import(
     fox112_excel: Path,
@@ -259,25 +189,28 @@ def build_passive_import(
     logger.info("Fox112: %d Fördernde Mitglieder", len(fox112_persons))
 
     feueron_entries = parse_erreichbarkeiten(feueron_erreichbarkeiten)
-    feueron_names: set[tuple[str, str]] = {
+    feueron_names = frozenset(
         (e.nachname.lower(), e.vorname.lower()) for e in feueron_entries
-    }
+    )
     logger.info("FeuerON: %d persons already present", len(feueron_names))
 
     xml_history = _read_xml_history(fox112_xml)
     logger.info("XML: %d persons with Dienstgrade/Funktionen", len(xml_history))
 
     # 2. Determine next PERSONAL_NR for persons that lack one
-    _PERS_NR_RE = re.compile(r"^Broe_F_(\d+)$")
+    prefix = "Broe_F_"
     max_nr = 0
     for fox in fox112_persons:
-        m = _PERS_NR_RE.match(fox.personal_nr)
-        if m:
-            max_nr = max(max_nr, int(m.group(1)))
+        personal_nr = fox.personal_nr
+        if personal_nr.startswith(prefix):
+            digits = personal_nr[len(prefix) :]
+            if digits.isdecimal():
+                max_nr = max(max_nr, int(digits))
     next_nr = max_nr + 1
 
-    # 3. Build PersonRecords
-    records: list[PersonRecord] = []
+    # 3. Build PersonRecords, split into those with and without Beiträge
+    records_with_beitrag: list[PersonRecord] = []
+    records_no_beitrag: list[PersonRecord] = []
     included = 0
     skipped_in_feueron = 0
     skipped_has_history = 0
@@ -301,7 +234,7 @@ def build_passive_import(
             skipped_has_history += 1
             continue
 
-        geschlecht = _GESCHLECHT_MAP.get(fox.geschlecht.upper())
+        geschlecht = GESCHLECHT_MAP.get(fox.geschlecht.upper())
         if geschlecht is None:
             logger.warning(
                 "Unknown GESCHLECHT '%s' for %s, %s — skipped",
@@ -323,8 +256,8 @@ def build_passive_import(
 
         # Build contact entries
         erreichbarkeiten: list[PvTelep] = []
-        for fox_field, tel_art, is_phone in _CONTACT_FIELDS:
-            value = getattr(fox, fox_field)
+        for fox_idx, tel_art, is_phone in _CONTACT_INDICES:
+            value = fox[fox_idx]
             if value:
                 formatted = _format_phone(value) if is_phone else value
                 erreichbarkeiten.append(PvTelep(TEL_ART=tel_art, TELEPHON=formatted))
@@ -374,7 +307,7 @@ def build_passive_import(
             skipped_declined += 1
             continue
 
-        records.append(
+        (records_with_beitrag if beitraege else records_no_beitrag).append(
             PersonRecord(
                 stammdaten=PvDb(
                     ORGANISATION=organisation,
@@ -402,10 +335,6 @@ def build_passive_import(
         )
         included += 1
 
-    # 4. Split into records with and without Beiträge
-    records_with_beitrag = [r for r in records if r.beitraege]
-    records_no_beitrag = [r for r in records if not r.beitraege]
-
     logger.info(
         "Passive import: %d included (%d with Beitrag, %d without), "
         "%d declined, %d already in FeuerON, "
@@ -420,6 +349,6 @@ def build_passive_import(
         skipped_no_geschlecht,
     )
 
-    # 5. Generate FeuerON CSVs
+    # 4. Generate FeuerON CSVs
     generate_csv(records_with_beitrag, output)
     generate_csv(records_no_beitrag, output_no_beitrag)
@@ -14,7 +14,6 @@ with the current page-1 flag so callers can apply the correct column offset.
 from __future__ import annotations
 
 import csv
-import io
 from pathlib import Path
 from typing import Iterator, NamedTuple
 
@@ -36,10 +35,12 @@ def iter_report_rows(path: Path) -> Iterator[ReportRow]:
     The ``is_page1`` flag indicates whether the row belongs to page 1
     (which has an extra empty column compared to subsequent pages).
     """
-    with open(path, encoding="utf-8-sig") as f:
-        content = f.read()
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        yield from _iter_data_rows(csv.reader(f, delimiter=";"))
 
-    reader = csv.reader(io.StringIO(content), delimiter=";")
+
+def _iter_data_rows(reader: Iterator[list[str]]) -> Iterator[ReportRow]:
+    """Filter the raw CSV rows of a report down to its data rows."""
     is_page1 = True
     in_header = True  # True until we see the first data row on a page
 
@@ -49,6 +50,13 @@ def iter_report_rows(path: Path) -> Iterator[ReportRow]:
 
         first = row[0].strip()
 
+        # A position number signals the start of data.  Checked first since
+        # most rows are data rows; a footer never starts with a digit.
+        if first.isdigit():
+            in_header = False
+            yield ReportRow(cells=row, is_page1=is_page1)
+            continue
+
         # Footer marks end of a page
         if first.startswith("Gesamtsumme"):
             in_header = True
@@ -60,12 +68,6 @@ def iter_report_rows(path: Path) -> Iterator[ReportRow]:
             in_header = True
             continue
 
-        # A position number signals the start of data
-        if first.isdigit():
-            in_header = False
-            yield ReportRow(cells=row, is_page1=is_page1)
-            continue
-
         # While in the header zone, skip everything (metadata, column
         # headers, sub-headers, report-title repetitions)
         if in_header:
@@ -6,6 +6,7 @@ import csv
 import datetime
 import io
 import types
+from collections.abc import Iterator
 from enum import IntEnum, StrEnum
 from pathlib import Path
 from typing import Annotated, Any, get_args, get_origin
@@ -312,6 +313,32 @@ def _serialize_value(value: Any) -> str | int | float:
     return str(value)
 
 
+def _iter_rows(
+    records: list[FeuerONRecord],
+    sub_table_info: list[tuple[str, type[FeuerONBase], bool]],
+    max_counts: dict[str, int],
+    used_fields: dict[str, list[str]],
+) -> Iterator[list[str | int | float]]:
+    """Yield one CSV row per record, padding missing sub-table entries."""
+    for record in records:
+        row: list[str | int | float] = []
+        for field_name, _model_cls, is_list in sub_table_info:
+            count = max_counts.get(field_name, 0)
+            csv_fields = used_fields.get(field_name, [])
+            if count == 0 or not csv_fields:
+                continue
+            entries = _get_entries(record, field_name, is_list)
+            num_fields = len(csv_fields)
+            for n in range(count):
+                if n < len(entries):
+                    data = entries[n].model_dump(mode="json")
+                    for csv_field in csv_fields:
+                        row.append(_serialize_value(data.get(csv_field)))
+                else:
+                    row.extend([""] * num_fields)
+        yield row
+
+
 def generate_csv(
     records: list[FeuerONRecord],
     output: Path | io.StringIO,
@@ -368,25 +395,8 @@ def generate_csv(
             for csv_field in csv_fields:
                 headers.append(f"{table}.{n}.{csv_field}")
 
-    # 4. Build rows
-    rows: list[list[str | int | float]] = []
-    for record in records:
-        row: list[str | int | float] = []
-        for field_name, model_cls, is_list in sub_table_info:
-            count = max_counts.get(field_name, 0)
-            csv_fields = used_fields.get(field_name, [])
-            if count == 0 or not csv_fields:
-                continue
-            entries = _get_entries(record, field_name, is_list)
-            num_fields = len(csv_fields)
-            for n in range(count):
-                if n < len(entries):
-                    data = entries[n].model_dump(mode="json")
-                    for csv_field in csv_fields:
-                        row.append(_serialize_value(data.get(csv_field)))
-                else:
-                    row.extend([""] * num_fields)
-        rows.append(row)
+    # 4. Build rows lazily, so only one row is in memory while writing
+    rows = _iter_rows(records, sub_table_info, max_counts, used_fields)
 
     # 5. Write CSV
     if isinstance(output, Path):
@@ -1,6 +1,7 @@
 """FeuerON screenshot automation using Playwright."""
 
 from pathlib import Path
+from typing import Iterator
 
 from playwright.sync_api import sync_playwright
 
@@ -17,12 +18,25 @@ def take_screenshots(output_dir: Path) -> list[Path]:
     Returns:
         List of paths to the saved screenshots
     """
+    screenshot_paths = list(iter_screenshots(output_dir))
+    print(f"\nScreenshots completed: {len(screenshot_paths)} files saved")
+    return screenshot_paths
+
+
+def iter_screenshots(output_dir: Path) -> Iterator[Path]:
+    """
+    Take screenshots of FeuerON application, yielding each path once saved.
+
+    Lets callers start processing a screenshot while the browser moves on
+    to the next page.
+
+    Args:
+        output_dir: Directory where screenshots will be saved
+    """
     username, password, region_id = get_credentials()
 
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    screenshot_paths: list[Path] = []
-
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         context = browser.new_context(viewport={"width": 1920, "height": 1080})
@@ -36,8 +50,8 @@ def take_screenshots(output_dir: Path) -> list[Path]:
         # Screenshot 1: Homepage (before login)
         path = output_dir / "01_feueron_homepage.png"
         page.screenshot(path=str(path), full_page=True)
-        screenshot_paths.append(path)
         print(f"Screenshot saved: {path}")
+        yield path
 
         # Fill login form
         print("Filling login form...")
@@ -50,8 +64,8 @@ def take_screenshots(output_dir: Path) -> list[Path]:
         # Screenshot 2: Form filled (before submit)
         path = output_dir / "02_feueron_form_filled.png"
         page.screenshot(path=str(path), full_page=True)
-        screenshot_paths.append(path)
         print(f"Screenshot saved: {path}")
+        yield path
 
         # Submit login form
         page.click('input[type="submit"]')
@@ -60,8 +74,8 @@ def take_screenshots(output_dir: Path) -> list[Path]:
         # Screenshot 3: After login
         path = output_dir / "03_feueron_logged_in.png"
         page.screenshot(path=str(path), full_page=True)
-        screenshot_paths.append(path)
         print(f"Screenshot saved: {path}")
+        yield path
 
         # Navigate to Berichte
         print("Navigating to Berichte...")
@@ -71,8 +85,8 @@ def take_screenshots(output_dir: Path) -> list[Path]:
         # Screenshot 4: Berichte page
         path = output_dir / "04_feueron_berichte.png"
         page.screenshot(path=str(path), full_page=True)
-        screenshot_paths.append(path)
         print(f"Screenshot saved: {path}")
+        yield path
 
         # Click on Dienstbuch tab
         print("Clicking Dienstbuch tab...")
@@ -83,10 +97,7 @@ def take_screenshots(output_dir: Path) -> list[Path]:
         path = output_dir / "05_feueron_dienstbuch.png"
         page.set_viewport_size({"width": 980, "height": 801})
         page.screenshot(path=str(path), full_page=True)
-        screenshot_paths.append(path)
         print(f"Screenshot saved: {path}")
+        yield path
 
         browser.close()
-
-    print(f"\nScreenshots completed: {len(screenshot_paths)} files saved")
-    return screenshot_paths
@@ -0,0 +1,53 @@
+"""Entry point of the ``info`` console script.
+
+A lone ``--version``/``-V`` or ``--help`` is answered here without
+importing Typer, Click or Rich; everything else is handed to the Typer
+application in :mod:`scripts.cli`.
+"""
+
+from __future__ import annotations
+
+import sys
+
+APP_HELP = "Feuerwehr Bröckel tools."
+GROUP_HELP = {
+    "screenshots": "Screenshot pipeline.",
+    "migration": "Fox112 → FeuerON data migration.",
+    "api": "FeuerON REST API client.",
+}
+
+
+def package_version() -> str:
+    """Return the installed version of the ``info`` package."""
+    from importlib.metadata import version
+
+    return version("info")
+
+
+def _fast_path(args: list[str]) -> bool:
+    """Print the answer to a lone ``--version`` or ``--help``; return True if handled."""
+    if len(args) != 1:
+        return False
+
+    flag = args[0]
+    if flag in ("--version", "-V"):
+        print(package_version())
+        return True
+    if flag == "--help":
+        print("Usage: info [OPTIONS] COMMAND [ARGS]...\n")
+        print(f"  {APP_HELP}\n")
+        print("Commands:")
+        for name, help_text in GROUP_HELP.items():
+            print(f"  {name:<12} {help_text}")
+        return True
+    return False
+
+
+def main() -> None:
+    """Run the ``info`` CLI."""
+    if _fast_path(sys.argv[1:]):
+        return
+
+    from scripts.cli import app
+
+    app()